@@ -22,14 +22,7 @@ def get_amadeus_access_token(api_key, api_secret):
         print(f"Error getting access token: {e}")
         return None
 
-def search_flight_offers(access_token, flight_params):
-    """
-    Searches for flight offers using the Amadeus API.
-    """
-    search_url = "https://test.api.amadeus.com/v2/shopping/flight-offers"
-    headers = {
-        "Authorization": f"Bearer {access_token}"
-    }
+def _flight_search_params(flight_params):
     # Dynamically build the search parameters from what GPT extracted
     params = {
         "originLocationCode": flight_params["originLocationCode"],
@@ -46,8 +39,25 @@ def search_flight_offers(access_token, flight_params):
                     params[param] = "true"
             else:
                 params[param] = flight_params[param]
+    return params
+
+def search_flight_offers_response(access_token, flight_params):
+    """
+    Sends a flight offers search and returns the raw response, so callers can
+    tell an expired token (401) from a rate limit (429). Raises on network errors.
+    """
+    search_url = "https://test.api.amadeus.com/v2/shopping/flight-offers"
+    headers = {
+        "Authorization": f"Bearer {access_token}"
+    }
+    return requests.get(search_url, headers=headers, params=_flight_search_params(flight_params))
+
+def search_flight_offers(access_token, flight_params):
+    """
+    Searches for flight offers using the Amadeus API.
+    """
     try:
-        search_response = requests.get(search_url, headers=headers, params=params)
+        search_response = search_flight_offers_response(access_token, flight_params)
         if search_response.status_code == 400:
             print(f"\n  [API Error 400] Details: {search_response.text}")
         search_response.raise_for_status()
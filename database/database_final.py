@@ -9,40 +9,203 @@ It creates:
     - unesco_by_country
     - tugo_* detail tables (climate, health, safety, laws, entry, offices)
     - numbeo_prices, numbeo_items, numbeo_exchange_rates, numbeo_indices
-    - airports, flight_costs
+    - airports, airport_hubs, flight_costs
 """
 
+import concurrent.futures
+import functools
+import hashlib
 import json
+import os
 import sqlite3
+import sys
+from collections import defaultdict
+from itertools import chain
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pyarrow  # noqa: F401  (enables pandas' multithreaded CSV engine)
+
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Stream the large nested JSON files (TuGo, climate) with ijson to cut peak
+# memory: always with STREAM_JSON=1, otherwise only for files big enough that
+# holding the parsed document next to the output columns hurts. Slower than a
+# full orjson parse, so the current (few MB) snapshots are parsed whole.
+STREAM_JSON = os.getenv("STREAM_JSON", "").lower() in ("1", "true", "yes")
+STREAM_JSON_MIN_BYTES = 64_000_000
+
+# Below this size the pyarrow engine's thread start-up costs more than it saves
+PYARROW_CSV_MIN_BYTES = 1_000_000
+
 
 # ======================================================================
 # Helper: locate data files
 # ======================================================================
 
+@functools.lru_cache(maxsize=None)
 def get_data_path(filename: str) -> str:
-    """Return the path to a data file, searching in data/, script dir, parent."""
+    """Return the path to a data file, searching in data/, script dir, parent.
+
+    Hits are cached; misses raise and are retried on the next call, so a
+    file fetched later in the run (e.g. pictures.json) is still found.
+    """
     script_dir = Path(__file__).parent
 
-    # Priority 1: data subdirectory
-    data_dir_path = script_dir / "data" / filename
-    if data_dir_path.exists():
-        return str(data_dir_path)
+    # In priority order: data subdirectory, script directory, parent directory
+    for base_dir in (script_dir / "data", script_dir, script_dir.parent):
+        path = base_dir / filename
+        if path.exists():
+            return str(path)
 
-    # Priority 2: script directory
-    file_path = script_dir / filename
-    if file_path.exists():
-        return str(file_path)
+    raise FileNotFoundError(f"Cannot find '{filename}'")
 
-    # Priority 3: parent directory
-    parent_path = script_dir.parent / filename
-    if parent_path.exists():
-        return str(parent_path)
 
-    raise FileNotFoundError(f"Cannot find '{filename}'")
+def read_csv(filepath: str, **kwargs) -> pd.DataFrame:
+    """pd.read_csv, switching to the pyarrow engine for large files when installed."""
+    if (
+        HAS_PYARROW
+        and os.path.getsize(filepath) >= PYARROW_CSV_MIN_BYTES
+        and not callable(kwargs.get("usecols"))  # unsupported by the pyarrow engine
+    ):
+        kwargs.setdefault("engine", "pyarrow")
+    return pd.read_csv(filepath, **kwargs)
+
+
+def load_json(filepath: str):
+    """Parse a JSON file (orjson if installed, else stdlib json)."""
+    if orjson is not None:
+        with open(filepath, "rb") as f:
+            return orjson.loads(f.read())
+    with open(filepath, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def iter_json_items(filepath: str, path: tuple = ()):
+    """Yield the items of the JSON array found under the keys in path.
+
+    Streams one item at a time with ijson when it is installed and either
+    STREAM_JSON is set or the file is at least STREAM_JSON_MIN_BYTES,
+    otherwise parses the whole file with load_json.
+    """
+    if ijson is not None and (
+        STREAM_JSON or os.path.getsize(filepath) >= STREAM_JSON_MIN_BYTES
+    ):
+        with open(filepath, "rb") as f:
+            yield from ijson.items(f, ".".join([*path, "item"]), use_float=True)
+        return
+
+    data = load_json(filepath)
+    for key in path:
+        data = data[key]
+    yield from data
+
+
+def dumps_json(value) -> str:
+    """Serialize value to compact JSON text (orjson if installed, else stdlib json)."""
+    if orjson is not None:
+        return orjson.dumps(value).decode("utf-8")
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+# ======================================================================
+# Helper: cache parsed loader output
+# ======================================================================
+
+# Bump whenever a cached loader's output changes, to invalidate old entries
+LOADER_CACHE_VERSION = 1
+LOADER_CACHE_DIR = Path(__file__).parent / "cache"
+
+# Source files are identified by (size, mtime) by default, which is enough for
+# files that are rewritten whole; LOADER_CACHE_HASH=1 hashes their contents
+# instead (reproducible builds, checkouts that reset mtimes)
+LOADER_CACHE_HASH = os.getenv("LOADER_CACHE_HASH", "").lower() in ("1", "true", "yes")
+
+
+def cached_loader(*filenames: str):
+    """Cache a loader's result on disk, keyed by the state of its source files.
+
+    The key covers LOADER_CACHE_VERSION, the loader name and, for each of
+    filenames (fallback names included; missing files count too), its size
+    and mtime, or its sha256 with LOADER_CACHE_HASH set, so a changed data
+    file is parsed again. Results are pickled because loaders
+    return tuples and dicts of columns as well as frames. Set
+    NO_LOADER_CACHE=1 to always parse.
+    """
+    def decorator(loader):
+        @functools.wraps(loader)
+        def wrapper():
+            if os.getenv("NO_LOADER_CACHE"):
+                return loader()
+
+            digest = hashlib.sha256(
+                f"{LOADER_CACHE_VERSION}:{LOADER_CACHE_HASH}:{loader.__name__}".encode()
+            )
+            for filename in filenames:
+                digest.update(filename.encode())
+                try:
+                    path = get_data_path(filename)
+                except FileNotFoundError:
+                    digest.update(b"<missing>")
+                    continue
+                if not LOADER_CACHE_HASH:
+                    stat = os.stat(path)
+                    digest.update(f"{stat.st_size}:{stat.st_mtime_ns}".encode())
+                    continue
+                with open(path, "rb") as f:
+                    for chunk in iter(lambda: f.read(1 << 20), b""):
+                        digest.update(chunk)
+
+            cache_path = LOADER_CACHE_DIR / f"{loader.__name__}-{digest.hexdigest()[:16]}.pkl"
+            if cache_path.exists():
+                print(f"  [INFO] {loader.__name__}: source unchanged, using {cache_path.name}")
+                return pd.read_pickle(cache_path)
+
+            result = loader()
+
+            # Replace any stale entry for this loader; write-then-rename so an
+            # interrupted run never leaves a truncated pickle behind
+            LOADER_CACHE_DIR.mkdir(exist_ok=True)
+            for stale in LOADER_CACHE_DIR.glob(f"{loader.__name__}-*.pkl"):
+                stale.unlink()
+            tmp_path = cache_path.with_suffix(".tmp")
+            pd.to_pickle(result, tmp_path)
+            os.replace(tmp_path, cache_path)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+# ======================================================================
+# Helper: column-wise record building
+# ======================================================================
+
+def append_row(columns: dict, *values) -> None:
+    """Append one row to a dict of column lists (values in column order)."""
+    for column, value in zip(columns.values(), values):
+        column.append(value)
+
+
+def intern_str(value):
+    """Intern repeated strings (categories, types) so equal values share one object."""
+    return sys.intern(value) if isinstance(value, str) else value
 
 
 # ======================================================================
@@ -50,9 +213,19 @@ def get_data_path(filename: str) -> str:
 # ======================================================================
 
 def load_iso_codes() -> pd.DataFrame:
-    """Load ISO country codes as the base reference table (index: iso3)."""
+    """Load ISO country codes as the base reference table (index: iso3).
+
+    The CSV is parsed once per process; each call gets its own copy to
+    modify freely.
+    """
+    return _read_iso_codes_csv().copy()
+
+
+@functools.lru_cache(maxsize=1)
+def _read_iso_codes_csv() -> pd.DataFrame:
+    """Parse the ISO country codes CSV (cached; use load_iso_codes())."""
     filepath = get_data_path("wikipedia-iso-country-codes.csv")
-    df = pd.read_csv(filepath)
+    df = read_csv(filepath)
     df = df.rename(
         columns={
             "English short name lower case": "country_name",
@@ -70,37 +243,46 @@ def load_iso_codes() -> pd.DataFrame:
 # PLI and historical exchange rates
 # ======================================================================
 
+# Values stay float64: rates span ~1e-4 to ~1e6, and float32 would shift the
+# stored REAL values (by up to ~40 units on the largest historical rates).
+
+@cached_loader("pli_data.csv")
 def load_pli_data() -> pd.DataFrame:
     """Load Price Level Index data (index: iso3, columns prefixed with pli_)."""
     filepath = get_data_path("pli_data.csv")
-    df = pd.read_csv(filepath)
-    df = df.rename(columns={"country_code": "iso3"})
-    if "country_name" in df.columns:
-        df = df.drop(columns=["country_name"])
-    df = df.set_index("iso3")
-    df.columns = ["pli_" + col for col in df.columns]
+    df = read_csv(filepath, usecols=lambda col: col != "country_name", index_col="country_code")
+    df = df.rename_axis("iso3").add_prefix("pli_")
     return df
 
 
+@cached_loader("exchange_data_full.csv")
 def load_exchange_data() -> pd.DataFrame:
     """Load historical exchange rate data (index: iso3, columns exchange_rate_YYYY)."""
     filepath = get_data_path("exchange_data_full.csv")
-    df = pd.read_csv(filepath)
-    df = df.rename(columns={"country_code": "iso3"})
-    if "country_name" in df.columns:
-        df = df.drop(columns=["country_name"])
-    df = df.set_index("iso3")
+    # Every column apart from the two identifiers is a yearly rate
+    dtypes = defaultdict(lambda: "float64", country_code="object", country_name="object")
+    df = read_csv(
+        filepath,
+        usecols=lambda col: col != "country_name",
+        index_col="country_code",
+        dtype=dtypes,
+    )
 
-    year_columns = [col for col in df.columns if col.isdigit()]
-    rename_dict = {col: f"exchange_rate_{col}" for col in year_columns}
-    df = df.rename(columns=rename_dict)
-    return df
+    df.columns = [f"exchange_rate_{col}" if col.isdigit() else col for col in df.columns]
+    return df.rename_axis("iso3")
 
 
 # ======================================================================
 # TuGo travel warnings (summary + details)
 # ======================================================================
 
+# Shared default for missing nested sections in the TuGo loop, so .get()
+# does not allocate a new dict per country (only ever read, never mutated);
+# missing lists default to the constant ()
+EMPTY_DICT = {}
+
+
+@cached_loader("tugo_travelwarnings.json", "all_travel_warnings.json")
 def load_tugo_travel_warnings_with_details():
     """
     Load TuGo travel warning data.
@@ -108,9 +290,11 @@ def load_tugo_travel_warnings_with_details():
     Returns
     -------
     summary_df : DataFrame
-        Summary information per country, indexed by iso3.
-    detail_dfs : dict[str, DataFrame]
-        Detail tables with iso2 as identifier:
+        Summary information per country, indexed by iso2 (TuGo's own key;
+        aligned to iso3 when merged into the countries table).
+    detail_tables : dict[str, dict[str, list]]
+        Detail tables as column name -> column values (iso2 as identifier),
+        written straight to SQLite without a DataFrame:
             tugo_climate, tugo_health, tugo_safety,
             tugo_laws, tugo_entry, tugo_offices
     """
@@ -125,20 +309,46 @@ def load_tugo_travel_warnings_with_details():
 
     print(f"  Loading TuGo data from: {filepath}")
 
-    with open(filepath, "r", encoding="utf-8") as f:
-        data = json.load(f)
-
-    print(f"  Found {len(data)} countries in TuGo data")
-
-    summary_records = []
-    climate_records = []
-    health_records = []
-    safety_records = []
-    laws_records = []
-    entry_records = []
-    offices_records = []
+    # Column-wise accumulators: one list per output column, appended in lockstep
+    info_columns = ["iso2", "country_name", "category", "description"]
+    summary_cols = {
+        col: []
+        for col in [
+            "iso2",
+            "tugo_country_name",
+            "tugo_advisory_state",
+            "tugo_advisory_text",
+            "tugo_has_warning",
+            "tugo_has_regional",
+            "tugo_published_date",
+            "tugo_recent_updates",
+            "tugo_advisories_desc",
+        ]
+    }
+    climate_cols = {col: [] for col in info_columns}
+    health_cols = {
+        col: [] for col in ["iso2", "country_name", "disease_name", "category", "description"]
+    }
+    safety_cols = {col: [] for col in info_columns}
+    laws_cols = {col: [] for col in info_columns}
+    entry_cols = {col: [] for col in info_columns}
+    offices_cols = {
+        col: []
+        for col in [
+            "iso2",
+            "country_name",
+            "office_type",
+            "city",
+            "address",
+            "phone",
+            "email",
+            "website",
+        ]
+    }
 
-    for country in data:
+    n_countries = 0
+    for country in iter_json_items(filepath):
+        n_countries += 1
         iso2 = country.get("code")
         country_name = country.get("name")
 
@@ -147,149 +357,135 @@ def load_tugo_travel_warnings_with_details():
             continue
 
         # Summary record
-        summary_records.append(
-            {
-                "iso2": iso2,
-                "tugo_country_name": country_name,
-                "tugo_advisory_state": country.get("advisoryState"),
-                "tugo_advisory_text": country.get("advisoryText"),
-                "tugo_has_warning": int(bool(country.get("hasAdvisoryWarning"))),
-                "tugo_has_regional": int(bool(country.get("hasRegionalAdvisory"))),
-                "tugo_published_date": country.get("publishedDate"),
-                "tugo_recent_updates": country.get("recentUpdates"),
-                "tugo_advisories_desc": country.get("advisories", {}).get("description"),
-            }
+        append_row(
+            summary_cols,
+            iso2,
+            country_name,
+            country.get("advisoryState"),
+            country.get("advisoryText"),
+            1 if country.get("hasAdvisoryWarning") else 0,
+            1 if country.get("hasRegionalAdvisory") else 0,
+            country.get("publishedDate"),
+            country.get("recentUpdates"),
+            country.get("advisories", EMPTY_DICT).get("description"),
         )
 
         # Climate info
-        climate_info = country.get("climate", {}).get("climateInfo", [])
+        climate_info = country.get("climate", EMPTY_DICT).get("climateInfo", ())
         for item in climate_info:
-            climate_records.append(
-                {
-                    "iso2": iso2,
-                    "country_name": country_name,
-                    "category": item.get("category"),
-                    "description": item.get("description"),
-                }
+            append_row(
+                climate_cols,
+                iso2,
+                country_name,
+                intern_str(item.get("category")),
+                item.get("description"),
             )
 
         # Health info
-        health_info = country.get("health", {})
-
-        diseases = health_info.get("diseasesAndVaccinesInfo", {})
-        for disease_name, disease_info_list in diseases.items():
-            for disease_info in disease_info_list:
-                health_records.append(
-                    {
-                        "iso2": iso2,
-                        "country_name": country_name,
-                        "disease_name": disease_name,
-                        "category": disease_info.get("category", ""),
-                        "description": disease_info.get("description"),
-                    }
-                )
-
-        for item in health_info.get("healthInfo", []):
-            health_records.append(
-                {
-                    "iso2": iso2,
-                    "country_name": country_name,
-                    "disease_name": "GENERAL",
-                    "category": item.get("category"),
-                    "description": item.get("description"),
-                }
+        health_info = country.get("health", EMPTY_DICT)
+
+        # Disease entries and the general health notes ("GENERAL") as one
+        # stream of (disease_name, category, description)
+        health_rows = chain(
+            (
+                (disease_name, disease_info.get("category", ""), disease_info.get("description"))
+                for disease_name, disease_info_list in health_info.get(
+                    "diseasesAndVaccinesInfo", EMPTY_DICT
+                ).items()
+                for disease_info in disease_info_list
+            ),
+            (
+                ("GENERAL", item.get("category"), item.get("description"))
+                for item in health_info.get("healthInfo", ())
+            ),
+        )
+        for disease_name, category, description in health_rows:
+            append_row(
+                health_cols,
+                iso2,
+                country_name,
+                intern_str(disease_name),
+                intern_str(category),
+                description,
             )
 
         # Safety info
-        safety_info = country.get("safety", {}).get("safetyInfo", [])
+        safety_info = country.get("safety", EMPTY_DICT).get("safetyInfo", ())
         for item in safety_info:
-            safety_records.append(
-                {
-                    "iso2": iso2,
-                    "country_name": country_name,
-                    "category": item.get("category"),
-                    "description": item.get("description"),
-                }
+            append_row(
+                safety_cols,
+                iso2,
+                country_name,
+                intern_str(item.get("category")),
+                item.get("description"),
             )
 
         # Law and culture
-        law_info = country.get("lawAndCulture", {}).get("lawAndCultureInfo", [])
+        law_info = country.get("lawAndCulture", EMPTY_DICT).get("lawAndCultureInfo", ())
         for item in law_info:
-            laws_records.append(
-                {
-                    "iso2": iso2,
-                    "country_name": country_name,
-                    "category": item.get("category"),
-                    "description": item.get("description"),
-                }
+            append_row(
+                laws_cols,
+                iso2,
+                country_name,
+                intern_str(item.get("category")),
+                item.get("description"),
             )
 
         # Entry/exit requirements
-        entry_info = country.get("entryExitRequirement", {})
-        for item in entry_info.get("requirementInfo", []):
-            entry_records.append(
-                {
-                    "iso2": iso2,
-                    "country_name": country_name,
-                    "category": item.get("category"),
-                    "description": item.get("description"),
-                }
+        entry_info = country.get("entryExitRequirement", EMPTY_DICT)
+        for item in entry_info.get("requirementInfo", ()):
+            append_row(
+                entry_cols,
+                iso2,
+                country_name,
+                intern_str(item.get("category")),
+                item.get("description"),
             )
 
         # Offices
-        for office in country.get("offices", []):
-            offices_records.append(
-                {
-                    "iso2": iso2,
-                    "country_name": country_name,
-                    "office_type": office.get("type"),
-                    "city": office.get("city"),
-                    "address": office.get("address"),
-                    "phone": office.get("phone"),
-                    "email": office.get("email1"),
-                    "website": office.get("website"),
-                }
+        for office in country.get("offices", ()):
+            append_row(
+                offices_cols,
+                iso2,
+                country_name,
+                intern_str(office.get("type")),
+                office.get("city"),
+                office.get("address"),
+                office.get("phone"),
+                office.get("email1"),
+                office.get("website"),
             )
 
-    summary_df = pd.DataFrame(summary_records)
+    print(f"  Found {n_countries} countries in TuGo data")
 
-    # Map ISO2 -> ISO3 for summary
-    iso_map = load_iso_codes().reset_index()[["iso2", "iso3"]]
-    summary_df = summary_df.merge(iso_map, on="iso2", how="left")
-    summary_df = summary_df.drop(columns=["iso2"])
-    summary_df = summary_df.set_index("iso3")
+    summary_index = pd.Index(summary_cols.pop("iso2"), name="iso2")
+    summary_df = pd.DataFrame(summary_cols, index=summary_index, copy=False)
 
-    climate_df = pd.DataFrame(climate_records)
-    health_df = pd.DataFrame(health_records)
-    safety_df = pd.DataFrame(safety_records)
-    laws_df = pd.DataFrame(laws_records)
-    entry_df = pd.DataFrame(entry_records)
-    offices_df = pd.DataFrame(offices_records)
+    detail_tables = {
+        "tugo_climate": climate_cols,
+        "tugo_health": health_cols,
+        "tugo_safety": safety_cols,
+        "tugo_laws": laws_cols,
+        "tugo_entry": entry_cols,
+        "tugo_offices": offices_cols,
+    }
 
     print("  Extracted TuGo detail records:")
-    print(f"    - Climate: {len(climate_df)}")
-    print(f"    - Health: {len(health_df)}")
-    print(f"    - Safety: {len(safety_df)}")
-    print(f"    - Laws: {len(laws_df)}")
-    print(f"    - Entry: {len(entry_df)}")
-    print(f"    - Offices: {len(offices_df)}")
-
-    detail_dfs = {
-        "tugo_climate": climate_df,
-        "tugo_health": health_df,
-        "tugo_safety": safety_df,
-        "tugo_laws": laws_df,
-        "tugo_entry": entry_df,
-        "tugo_offices": offices_df,
-    }
+    print(f"    - Climate: {len(climate_cols['iso2'])}")
+    print(f"    - Health: {len(health_cols['iso2'])}")
+    print(f"    - Safety: {len(safety_cols['iso2'])}")
+    print(f"    - Laws: {len(laws_cols['iso2'])}")
+    print(f"    - Entry: {len(entry_cols['iso2'])}")
+    print(f"    - Offices: {len(offices_cols['iso2'])}")
 
-    return summary_df, detail_dfs
+    return summary_df, detail_tables
 
 
 # ======================================================================
 # German Foreign Office travel warnings
 # ======================================================================
 
+@cached_loader("foreign_office_travelwarnings.json", "travelwarnings_snapshot.json")
 def load_foreign_office_travel_warnings() -> pd.DataFrame:
     """Load German Foreign Office travel warning data (index: iso3)."""
     try:
@@ -301,17 +497,12 @@ def load_foreign_office_travel_warnings() -> pd.DataFrame:
             print("  [INFO] Foreign Office travel warnings file not found, skipping.")
             return pd.DataFrame()
 
-    with open(filepath, "r", encoding="utf-8") as f:
-        data = json.load(f)
-
-    df = pd.DataFrame(data)
-    df = df.rename(columns={"iso3_country_code": "iso3"})
-    cols_to_drop = ["country_code", "country_name"]
-    df = df.drop(columns=[c for c in cols_to_drop if c in df.columns])
+    data = load_json(filepath)
 
-    cols_to_prefix = [col for col in df.columns if col != "iso3"]
-    df = df.rename(columns={col: f"fo_{col}" for col in cols_to_prefix})
-    df = df.set_index("iso3")
+    df = pd.DataFrame(data).set_index("iso3_country_code")
+    df = df.drop(columns=["country_code", "country_name"], errors="ignore")
+    df.index.name = "iso3"
+    df.columns = [f"fo_{col}" for col in df.columns]
     return df
 
 
@@ -319,44 +510,54 @@ def load_foreign_office_travel_warnings() -> pd.DataFrame:
 # Climate data
 # ======================================================================
 
+@cached_loader("country_monthly_climate_2005_2024.json")
 def load_climate_data() -> pd.DataFrame:
     """Load monthly climate data from JSON, one row per country."""
     filepath = get_data_path("country_monthly_climate_2005_2024.json")
-    with open(filepath, "r", encoding="utf-8") as f:
-        data = json.load(f)
-
-    countries_data = data["countries"]
-    climate_records = []
-
-    for country_entry in countries_data:
-        country_name = country_entry["country"]
-        months = country_entry.get("months", [])
-        if not months:
-            continue
-
-        temps = [m["temp_c_clim"] for m in months if m.get("temp_c_clim") is not None]
-        clouds = [m["cloud_pct"] for m in months if m.get("cloud_pct") is not None]
-        precips = [m["precip_mm"] for m in months if m.get("precip_mm") is not None]
-
-        record = {
-            "country_name_climate": country_name,
-            "climate_avg_temp_c": sum(temps) / len(temps) if temps else None,
-            "climate_avg_cloud_pct": sum(clouds) / len(clouds) if clouds else None,
-            "climate_total_precip_mm": sum(precips) if precips else None,
-            "climate_avg_monthly_precip_mm": (
-                sum(precips) / len(precips) if precips else None
-            ),
-        }
-
-        for month_data in months:
-            month_num = month_data["month"]
-            record[f"climate_temp_month_{month_num}"] = month_data.get("temp_c_clim")
-            record[f"climate_cloud_month_{month_num}"] = month_data.get("cloud_pct")
-            record[f"climate_precip_month_{month_num}"] = month_data.get("precip_mm")
 
-        climate_records.append(record)
+    # Long format: one row per (country, month)
+    long_df = pd.DataFrame(
+        [
+            (
+                country_entry["country"],
+                month_data["month"],
+                month_data.get("temp_c_clim"),
+                month_data.get("cloud_pct"),
+                month_data.get("precip_mm"),
+            )
+            for country_entry in iter_json_items(filepath, ("countries",))
+            for month_data in country_entry.get("months", [])
+        ],
+        columns=["country", "month", "temp", "cloud", "precip"],
+    )
+    long_df[["temp", "cloud", "precip"]] = long_df[["temp", "cloud", "precip"]].astype(float)
+
+    # Groups come out in file order (sort=False); a country without any
+    # precipitation values keeps a NULL total rather than 0
+    summary = long_df.groupby("country", sort=False).agg(
+        climate_avg_temp_c=("temp", "mean"),
+        climate_avg_cloud_pct=("cloud", "mean"),
+        climate_total_precip_mm=("precip", "sum"),
+        climate_avg_monthly_precip_mm=("precip", "mean"),
+        precip_count=("precip", "count"),
+    )
+    precip_count = summary.pop("precip_count")
+    summary["climate_total_precip_mm"] = summary["climate_total_precip_mm"].where(
+        precip_count > 0
+    )
 
-    df = pd.DataFrame(climate_records)
+    # Wide monthly columns: climate_{temp,cloud,precip}_month_{n}, month-major
+    monthly = long_df.pivot(index="country", columns="month", values=["temp", "cloud", "precip"])
+    monthly_columns = [
+        (metric, month)
+        for month in sorted(long_df["month"].unique())
+        for metric in ("temp", "cloud", "precip")
+    ]
+    monthly = monthly[monthly_columns]
+    monthly.columns = [f"climate_{metric}_month_{month}" for metric, month in monthly_columns]
+
+    df = summary.join(monthly)
+    df = df.rename_axis("country_name_climate").reset_index()
     return df
 
 
@@ -364,6 +565,7 @@ def load_climate_data() -> pd.DataFrame:
 # UNESCO heritage sites and summary by country
 # ======================================================================
 
+@cached_loader("unesco_sites_full.json")
 def load_unesco_heritage_data() -> pd.DataFrame:
     """Load UNESCO World Heritage Sites data."""
     try:
@@ -372,14 +574,14 @@ def load_unesco_heritage_data() -> pd.DataFrame:
         print("  [WARNING] UNESCO heritage sites file not found, skipping.")
         return pd.DataFrame()
 
-    with open(filepath, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = load_json(filepath)
 
     print(f"  Found {len(data)} UNESCO heritage sites")
     df = pd.DataFrame(data)
     return df
 
 
+@cached_loader("unesco_by_country.json")
 def load_unesco_by_country_data() -> pd.DataFrame:
     """Load summary of UNESCO World Heritage Sites by country."""
     try:
@@ -388,20 +590,17 @@ def load_unesco_by_country_data() -> pd.DataFrame:
         print("  [WARNING] UNESCO by country file not found, skipping.")
         return pd.DataFrame()
 
-    with open(filepath, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = load_json(filepath)
 
     print(f"  Found {len(data)} UNESCO country summary records")
     df = pd.DataFrame(data)
 
-    if "site_names" in df.columns:
-        df["site_names"] = df["site_names"].apply(
-            lambda x: json.dumps(x) if isinstance(x, list) else x
-        )
-    if "site_ids" in df.columns:
-        df["site_ids"] = df["site_ids"].apply(
-            lambda x: json.dumps(x) if isinstance(x, list) else x
-        )
+    # SQLite cannot store lists: serialize them as JSON text
+    for col in ("site_names", "site_ids"):
+        if col in df.columns:
+            df[col] = [
+                dumps_json(x) if isinstance(x, list) else x for x in df[col].to_numpy()
+            ]
 
     return df
 
@@ -410,6 +609,7 @@ def load_unesco_by_country_data() -> pd.DataFrame:
 # Numbeo data
 # ======================================================================
 
+@cached_loader("numbeo_countries.csv")
 def load_numbeo_countries() -> pd.DataFrame:
     """
     Load Numbeo country metadata: country_name, currency, iso3, country_param_used.
@@ -423,7 +623,7 @@ def load_numbeo_countries() -> pd.DataFrame:
         print("  [INFO] numbeo_countries.csv not found, skipping Numbeo country metadata.")
         return pd.DataFrame()
 
-    df = pd.read_csv(filepath)
+    df = read_csv(filepath)
 
     df = df.rename(
         columns={
@@ -440,6 +640,19 @@ def load_numbeo_countries() -> pd.DataFrame:
     return df
 
 
+NUMBEO_PRICES_DTYPES = {
+    "lowest_price": "float64",
+    "average_price": "float64",
+    "highest_price": "float64",
+    "item_name": "object",
+    "country_name": "object",
+    "currency": "object",
+    "country_param_used": "object",
+    "iso3": "object",
+}
+
+
+@cached_loader("numbeo_country_prices.csv")
 def load_numbeo_prices() -> pd.DataFrame:
     """
     Load Numbeo country prices (large fact table).
@@ -451,10 +664,13 @@ def load_numbeo_prices() -> pd.DataFrame:
         print("  [INFO] numbeo_country_prices.csv not found, skipping Numbeo prices.")
         return pd.DataFrame()
 
-    df = pd.read_csv(filepath)
+    # Integer columns (item_id, data_points) are left to inference so a gap
+    # in a future export degrades to float instead of failing the build
+    df = read_csv(filepath, dtype=NUMBEO_PRICES_DTYPES)
     return df
 
 
+@cached_loader("numbeo_exchange_rates.csv")
 def load_numbeo_exchange_rates() -> pd.DataFrame:
     """
     Load Numbeo exchange rates (per currency).
@@ -467,12 +683,13 @@ def load_numbeo_exchange_rates() -> pd.DataFrame:
         print("  [INFO] numbeo_exchange_rates.csv not found, skipping Numbeo exchange rates.")
         return pd.DataFrame()
 
-    df = pd.read_csv(filepath)
+    df = read_csv(filepath, dtype=defaultdict(lambda: "float64", currency="object"))
     if "currency" in df.columns:
         df = df.set_index("currency")
     return df
 
 
+@cached_loader("numbeo_country_indices.csv")
 def load_numbeo_indices() -> pd.DataFrame:
     """
     Load Numbeo country indices (cost of living, quality of life, etc.).
@@ -486,28 +703,23 @@ def load_numbeo_indices() -> pd.DataFrame:
         print("  [INFO] numbeo_country_indices.csv not found, skipping Numbeo indices.")
         return pd.DataFrame()
 
-    df = pd.read_csv(filepath)
+    df = read_csv(filepath)
 
     if "iso3" not in df.columns:
         print("  [WARNING] numbeo_country_indices.csv has no iso3 column, skipping.")
         return pd.DataFrame()
 
-    if "country_name" in df.columns:
-        df = df.rename(columns={"country_name": "numbeo_country_name_indices"})
-
-    rename_map = {}
-    for col in df.columns:
-        if col in ("iso3", "numbeo_country_name_indices"):
-            continue
-        rename_map[col] = f"numbeo_{col}"
-
-    df = df.rename(columns=rename_map)
     df = df.set_index("iso3")
+    df.columns = [
+        "numbeo_country_name_indices" if col == "country_name" else f"numbeo_{col}"
+        for col in df.columns
+    ]
     return df
 
 # ======================================================================
 # Load Tarot Travel Database
 # ======================================================================
+@cached_loader("complete_tarot_travel_database.json")
 def load_tarot_travel_database() -> pd.DataFrame:
     """Load tarot cards with country associations."""
     try:
@@ -516,8 +728,7 @@ def load_tarot_travel_database() -> pd.DataFrame:
         print("  [INFO] complete_tarot_travel_database.json not found, skipping Tarot data.")
         return pd.DataFrame()
 
-    with open(filepath, "r", encoding="utf-8") as f:
-        raw_data = json.load(f)
+    raw_data = load_json(filepath)
     
     # Handle both list and dict formats
     if isinstance(raw_data, list):
@@ -538,52 +749,55 @@ def load_tarot_travel_database() -> pd.DataFrame:
         # Already in dict format
         tarot_data = raw_data
 
-    tarot_records = []
+    # Major and minor arcana share one loop: (arcana_type, card) pairs
+    cards = [("major", card) for card in tarot_data.get("major_arcana", [])]
+    cards += [
+        (f"minor_{suit}", card)
+        for suit, suit_cards in tarot_data.get("minor_arcana", {}).items()
+        for card in suit_cards
+    ]
 
-    # Process Major Arcana
-    for card in tarot_data.get("major_arcana", []):
-        for orientation in ["upright", "reversed"]:
+    tarot_rows = []
+    for arcana_type, card in cards:
+        card_id = card.get("id") or card.get("sequence")
+        card_name = card["name"]
+
+        for orientation in ("upright", "reversed"):
             card_info = card.get(orientation, {})
-            countries = card_info.get("countries", [])
-            
-            for country in countries:
-                tarot_records.append({
-                    "card_id": card.get("id") or card.get("sequence"),
-                    "card_name": card["name"],
-                    "arcana_type": "major",
-                    "orientation": orientation,
-                    "country_code": country["code"],
-                    "country_name": country["name"],
-                    "reason": country.get("reason", ""),
-                    "keywords": json.dumps(card_info.get("keywords", [])),
-                    "travel_meaning": card_info.get("travel_meaning", ""),
-                    "travel_style": card_info.get("travel_style", ""),
-                })
-
-    # Process Minor Arcana
-    for suit, cards in tarot_data.get("minor_arcana", {}).items():
-        for card in cards:
-            card_id = card.get("id") or card.get("sequence")
-            
-            for orientation in ["upright", "reversed"]:
-                card_info = card.get(orientation, {})
-                countries = card_info.get("countries", [])
-                
-                for country in countries:
-                    tarot_records.append({
-                        "card_id": card_id,
-                        "card_name": card["name"],
-                        "arcana_type": f"minor_{suit}",
-                        "orientation": orientation,
-                        "country_code": country["code"],
-                        "country_name": country["name"],
-                        "reason": country.get("reason", ""),
-                        "keywords": json.dumps(card_info.get("keywords", [])),
-                        "travel_meaning": card_info.get("travel_meaning", ""),
-                        "travel_style": card_info.get("travel_style", ""),
-                    })
-
-    df = pd.DataFrame(tarot_records)
+            # Shared by every country of this card orientation
+            keywords = dumps_json(card_info.get("keywords", []))
+            travel_meaning = card_info.get("travel_meaning", "")
+            travel_style = card_info.get("travel_style", "")
+
+            for country in card_info.get("countries", []):
+                tarot_rows.append((
+                    card_id,
+                    card_name,
+                    arcana_type,
+                    orientation,
+                    country["code"],
+                    country["name"],
+                    country.get("reason", ""),
+                    keywords,
+                    travel_meaning,
+                    travel_style,
+                ))
+
+    df = pd.DataFrame.from_records(
+        tarot_rows,
+        columns=[
+            "card_id",
+            "card_name",
+            "arcana_type",
+            "orientation",
+            "country_code",
+            "country_name",
+            "reason",
+            "keywords",
+            "travel_meaning",
+            "travel_style",
+        ],
+    )
     print(f"  Loaded {len(df)} tarot-country associations")
     return df
 
@@ -631,34 +845,35 @@ def load_pictures_data() -> pd.DataFrame:
             return pd.DataFrame()
 
     try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = load_json(filepath)
 
         if not data:
             return pd.DataFrame()
 
-        records = []
+        # One list per output column; slots holds the three (img, credit,
+        # credit_url) column lists so the loop never builds key strings
+        columns = {"iso3": []}
+        slots = []
+        for suffix in ("1", "2", "3"):
+            img_col, credit_col, credit_url_col = [], [], []
+            columns[f"img_{suffix}"] = img_col
+            columns[f"credit_{suffix}"] = credit_col
+            columns[f"credit_url_{suffix}"] = credit_url_col
+            slots.append((img_col, credit_col, credit_url_col))
+
+        no_image = {}
         for entry in data:
-            record = {"iso3": entry["iso3"]}
+            columns["iso3"].append(entry["iso3"])
             images = entry.get("images", [])
 
-            for i in range(3):
-                suffix = str(i + 1)
-                if i < len(images):
-                    img = images[i]
-                    record[f"img_{suffix}"] = img.get("image_url")
-                    record[f"credit_{suffix}"] = img.get("photographer_name")
-                    record[f"credit_url_{suffix}"] = img.get("photographer_url")
-                else:
-                    record[f"img_{suffix}"] = None
-                    record[f"credit_{suffix}"] = None
-                    record[f"credit_url_{suffix}"] = None
-
-            records.append(record)
-
-        df = pd.DataFrame(records)
-        df = df.set_index("iso3")
-        return df
+            for i, (img_col, credit_col, credit_url_col) in enumerate(slots):
+                img = images[i] if i < len(images) else no_image
+                img_col.append(img.get("image_url"))
+                credit_col.append(img.get("photographer_name"))
+                credit_url_col.append(img.get("photographer_url"))
+
+        index = pd.Index(columns.pop("iso3"), name="iso3")
+        return pd.DataFrame(columns, index=index, copy=False)
 
     except Exception as e:
         print(f"  [ERROR] Error reading pictures.json: {e}")
@@ -683,16 +898,16 @@ def load_airports_data() -> pd.DataFrame:
         return pd.DataFrame()
 
 
-def load_flight_network_data(airports_df: pd.DataFrame) -> pd.DataFrame:
-    """Load flight cost data, depending on existing airport data."""
-    if airports_df.empty:
+def load_flight_network_data(hubs_df: pd.DataFrame) -> pd.DataFrame:
+    """Load flight cost data between the country hub airports (hubs_df)."""
+    if hubs_df.empty:
         print("  [INFO] No airport data available. Skipping flight network.")
         return pd.DataFrame()
 
     try:
         from fetch_route_prices import get_flight_network_data
 
-        return get_flight_network_data(airports_df)
+        return get_flight_network_data(hubs_df)
     except ImportError:
         print("  [INFO] fetch_route_prices.py not found. Skipping flight network.")
         return pd.DataFrame()
@@ -700,13 +915,50 @@ def load_flight_network_data(airports_df: pd.DataFrame) -> pd.DataFrame:
         print(f"  [ERROR] Error loading flight network: {e}")
         return pd.DataFrame()
 
+
+def load_airports_and_flight_network():
+    """
+    Load airports (one row per IATA code) and then the flight network built on them.
+
+    Chained in one call so the slow flight fetch can run in the loader thread
+    pool alongside the other sources. Returns (airports_df, hubs_df,
+    flight_costs_df), where hubs_df is the busiest airport of every country.
+    """
+    airports_df = load_airports_data()
+    hubs_df = pd.DataFrame()
+    if not airports_df.empty:
+        # One row per IATA code: the one with the highest page_rank (rows
+        # without a rank only win if none has one). idxmax per group avoids
+        # sorting the whole table; only the deduplicated result is sorted,
+        # so the airports table keeps its page_rank-descending order.
+        airports_df = airports_df.reset_index(drop=True)
+        page_rank = airports_df['page_rank'].fillna(float('-inf'))
+        best_rows = page_rank.groupby(airports_df['iata_code'], sort=False, dropna=False).idxmax()
+        airports_df = airports_df.loc[best_rows].sort_values(
+            'page_rank', ascending=False, kind='stable'
+        ).reset_index(drop=True)
+
+        # Busiest airport per country: the origins/destinations of the flight
+        # network, computed once here and stored as airport_hubs. The stable
+        # sort keeps page_rank order among equal volumes (including countries
+        # with no volume at all), so ties go to the highest-ranked airport.
+        hubs_df = airports_df.sort_values(
+            'passenger_volume', ascending=False, kind='stable'
+        ).groupby('iso2', sort=False).head(1)
+
+    flight_costs_df = load_flight_network_data(hubs_df)
+    return airports_df, hubs_df, flight_costs_df
+
 # ======================================================================
 # Equality Index Data
 # ======================================================================
 
 
-def load_equality_index_data() -> pd.DataFrame:
-    """Load LGBT Equality Index scores (indexed by iso3)."""
+def load_equality_index_data(iso_df: pd.DataFrame = None) -> pd.DataFrame:
+    """Load LGBT Equality Index scores (indexed by iso3).
+
+    iso_df: already loaded ISO codes for the ISO2 -> ISO3 mapping (optional).
+    """
     try:
         filepath = get_data_path("equality_index_data.json")
     except FileNotFoundError:
@@ -715,120 +967,278 @@ def load_equality_index_data() -> pd.DataFrame:
 
     print(f"  Loading Equality Index data from: {filepath}")
 
-    with open(filepath, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = load_json(filepath)
+
+    # Plain dict lookup for ISO2 -> ISO3 instead of a merge on ~200 rows
+    if iso_df is None:
+        iso_df = load_iso_codes()
+    iso2_to_iso3 = dict(zip(iso_df["iso2"], iso_df.index))
 
+    iso3 = []
     records = []
     for entry in data:
-        records.append({
-            "iso2": entry.get("region_id"),
-            "equality_index_score": entry.get("ei"),
-            "equality_index_legal": entry.get("ei_legal"),
-            "equality_index_public_opinion": entry.get("ei_po"),
-            "equality_index_rank": entry.get("rank"),
-        })
-
-    df = pd.DataFrame(records)
-    
-    # Map iso2 to iso3
-    iso_map = load_iso_codes().reset_index()[["iso2", "iso3"]]
-    df = df.merge(iso_map, on="iso2", how="left")
-    df = df.drop(columns=["iso2"])
-    df = df.set_index("iso3")
-    
+        iso3.append(iso2_to_iso3.get(entry.get("region_id")))
+        records.append((
+            entry.get("ei"),
+            entry.get("ei_legal"),
+            entry.get("ei_po"),
+            entry.get("rank"),
+        ))
+
+    df = pd.DataFrame(
+        records,
+        columns=[
+            "equality_index_score",
+            "equality_index_legal",
+            "equality_index_public_opinion",
+            "equality_index_rank",
+        ],
+        index=pd.Index(iso3, name="iso3"),
+    )
+
     print(f"  Loaded {len(df)} countries from Equality Index")
     return df
 
 
 # ======================================================================
-# Main: create unified SQLite database
+# Merge helpers
 # ======================================================================
 
-def create_unified_database(output_db: str = "unified_country_database.db"):
-    """Create a unified SQLite database from all data sources."""
+def one_row_per_key(
+    df: pd.DataFrame,
+    source: str,
+    names: pd.Series = None,
+    name_col: str = None,
+) -> pd.DataFrame:
+    """Drop rows without an index key and repeated keys before a join.
 
-    print("\n" + "=" * 60)
-    print("UNIFIED COUNTRY DATABASE CREATOR - FIXED")
-    print("=" * 60)
-    print("\nLoading data sources...")
+    Of a repeated key, the row whose name_col equals the reference name in
+    names (country names indexed by the same key) wins; otherwise the first.
+    """
+    df = df[~df.index.isna()]
+    if not df.index.has_duplicates:
+        return df
 
-    print("  - ISO country codes (base table)")
-    iso_df = load_iso_codes()
+    if names is not None and name_col in df.columns:
+        expected = names[~names.index.duplicated()].reindex(df.index).to_numpy()
+        matches = df[name_col].to_numpy() == expected
+        # Matching rows first; the stable sort keeps file order otherwise
+        order = np.argsort(~matches, kind="stable")
+    else:
+        order = np.arange(len(df))
+    winners = np.sort(order[~df.index[order].duplicated(keep="first")])
+
+    kept = df.iloc[winners]
+    keys = sorted(set(df.index[df.index.duplicated()]))
+    if name_col in df.columns:
+        chosen = ", ".join(f"{key} -> {kept.at[key, name_col]!r}" for key in keys)
+    else:
+        chosen = ", ".join(keys)
+    print(f"  [WARNING] {source}: duplicate {df.index.name}, keeping one row each: {chosen}")
+    return kept
 
-    print("  - PLI (Price Level Index) data")
-    pli_df = load_pli_data()
 
-    print("  - Exchange rate data")
-    exchange_df = load_exchange_data()
+# ======================================================================
+# SQLite bulk-load helpers
+# ======================================================================
+
+# The build rewrites the live database in place (DROP + CREATE per table) and
+# runs unattended every day, so the on-disk rollback journal is kept: a crash
+# or power loss mid-build rolls back to the previous data instead of leaving a
+# corrupt file. synchronous = NORMAL still syncs at the critical points of a
+# commit (FULL adds a few more); the build is a single transaction plus
+# ANALYZE, so there are only a handful of syncs in total.
+# The writes are I/O-bound (page writes while filling B-trees and building
+# indexes), so the page cache (200 MB) holds the whole ~20 MB file, temp
+# tables stay in memory and reads go through mmap.
+# locking_mode stays NORMAL so the app can keep reading the previous data
+# until the build commits.
+SQLITE_BULK_LOAD_PRAGMAS = """
+PRAGMA journal_mode = DELETE;
+PRAGMA synchronous = NORMAL;
+PRAGMA temp_store = MEMORY;
+PRAGMA cache_size = -200000;
+PRAGMA mmap_size = 268435456;
+"""
 
-    print("  - TuGo travel warnings with details")
-    tugo_summary_df, tugo_detail_dfs = load_tugo_travel_warnings_with_details()
+# Both writers below leave transaction control to the caller, so the whole
+# build (tables + indexes) can be committed once.
+
+def write_table(df: pd.DataFrame, table_name: str, conn: sqlite3.Connection) -> None:
+    """Replace table_name with df (same schema as to_sql, rows via executemany)."""
+    placeholders = ", ".join("?" for _ in df.columns)
+    conn.execute(f'DROP TABLE IF EXISTS "{table_name}"')
+    conn.execute(pd.io.sql.get_schema(df, table_name, con=conn))
+    # NaN is bound as NULL by sqlite3, matching to_sql
+    conn.executemany(
+        f'INSERT INTO "{table_name}" VALUES ({placeholders})',
+        df.itertuples(index=False, name=None),
+    )
 
-    print("  - Foreign Office travel warnings")
-    fo_df = load_foreign_office_travel_warnings()
 
-    print("  - Climate data")
-    climate_df = load_climate_data()
+def write_text_columns(columns: dict, table_name: str, conn: sqlite3.Connection) -> None:
+    """Replace table_name with TEXT columns given as name -> values lists."""
+    column_defs = ", ".join(f'"{name}" TEXT' for name in columns)
+    placeholders = ", ".join("?" for _ in columns)
+    conn.execute(f'DROP TABLE IF EXISTS "{table_name}"')
+    conn.execute(f'CREATE TABLE "{table_name}" ({column_defs})')
+    conn.executemany(
+        f'INSERT INTO "{table_name}" VALUES ({placeholders})',
+        zip(*columns.values()),
+    )
 
-    print("  - UNESCO World Heritage Sites")
-    unesco_df = load_unesco_heritage_data()
 
-    print("  - Numbeo countries / prices / exchange rates / indices")
-    numbeo_countries_df = load_numbeo_countries()
-    numbeo_prices_df = load_numbeo_prices()
-    numbeo_exchange_df = load_numbeo_exchange_rates()
-    numbeo_indices_df = load_numbeo_indices()
+# Every index is built once, after all tables are filled: inserting into an
+# already indexed table updates each B-tree row by row, while CREATE INDEX on
+# a loaded table sorts once. Keep it that way if tables are ever appended to.
+INDEX_DEFS = [
+    ("countries", "CREATE INDEX IF NOT EXISTS idx_countries_iso3 ON countries(iso3)"),
+    ("climate_monthly", "CREATE INDEX IF NOT EXISTS idx_climate_country ON climate_monthly(country_name_climate)"),
+    # TuGo detail tables (iso2). Composite where info boxes look up
+    # (iso2, disease_name) / (iso2, category); the iso2 prefix still serves
+    # the plain iso2 lookups
+    ("tugo_climate", "CREATE INDEX IF NOT EXISTS idx_tugo_climate_iso2 ON tugo_climate(iso2)"),
+    ("tugo_health", "CREATE INDEX IF NOT EXISTS idx_tugo_health_iso2_disease ON tugo_health(iso2, disease_name)"),
+    ("tugo_safety", "CREATE INDEX IF NOT EXISTS idx_tugo_safety_iso2_category ON tugo_safety(iso2, category)"),
+    ("tugo_laws", "CREATE INDEX IF NOT EXISTS idx_tugo_laws_iso2 ON tugo_laws(iso2)"),
+    ("tugo_entry", "CREATE INDEX IF NOT EXISTS idx_tugo_entry_iso2 ON tugo_entry(iso2)"),
+    ("tugo_offices", "CREATE INDEX IF NOT EXISTS idx_tugo_offices_iso2 ON tugo_offices(iso2)"),
+    # UNESCO
+    ("unesco_heritage_sites", "CREATE INDEX IF NOT EXISTS idx_unesco_country_iso ON unesco_heritage_sites(country_iso)"),
+    ("unesco_heritage_sites", "CREATE INDEX IF NOT EXISTS idx_unesco_id ON unesco_heritage_sites(id)"),
+    ("unesco_by_country", "CREATE INDEX IF NOT EXISTS idx_unesco_by_country_iso_code ON unesco_by_country(iso_code)"),
+    # Airports / flights
+    ("airports", "CREATE UNIQUE INDEX IF NOT EXISTS idx_airports_iata ON airports(iata_code)"),
+    ("airports", "CREATE INDEX IF NOT EXISTS idx_airports_iso2 ON airports(iso2)"),
+    ("airport_hubs", "CREATE UNIQUE INDEX IF NOT EXISTS idx_airport_hubs_iso2 ON airport_hubs(iso2)"),
+    ("flight_costs", "CREATE INDEX IF NOT EXISTS idx_flights_origin ON flight_costs(origin)"),
+    ("flight_costs", "CREATE INDEX IF NOT EXISTS idx_flights_dest ON flight_costs(destination)"),
+    # Numbeo
+    ("numbeo_prices", "CREATE INDEX IF NOT EXISTS idx_numbeo_prices_iso3 ON numbeo_prices(iso3)"),
+    ("numbeo_prices", "CREATE INDEX IF NOT EXISTS idx_numbeo_prices_item ON numbeo_prices(item_id)"),
+    ("numbeo_items", "CREATE INDEX IF NOT EXISTS idx_numbeo_items_id ON numbeo_items(item_id)"),
+    ("numbeo_exchange_rates", "CREATE INDEX IF NOT EXISTS idx_numbeo_exrates_currency ON numbeo_exchange_rates(currency)"),
+    ("numbeo_indices", "CREATE INDEX IF NOT EXISTS idx_numbeo_indices_iso3 ON numbeo_indices(iso3)"),
+    # Tarot
+    ("tarot_countries", "CREATE INDEX IF NOT EXISTS idx_tarot_country_code ON tarot_countries(country_code)"),
+    ("tarot_countries", "CREATE INDEX IF NOT EXISTS idx_tarot_card_name ON tarot_countries(card_name)"),
+    ("tarot_countries", "CREATE INDEX IF NOT EXISTS idx_tarot_orientation ON tarot_countries(orientation)"),
+    # Equality Index
+    ("equality_index", "CREATE INDEX IF NOT EXISTS idx_equality_index_iso3 ON equality_index(iso3)"),
+]
+
+
+def build_indexes(conn: sqlite3.Connection) -> None:
+    """Create INDEX_DEFS for the tables that exist (call after all writes)."""
+    existing_tables = {
+        row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")
+    }
+    for table_name, sql in INDEX_DEFS:
+        if table_name in existing_tables:
+            conn.execute(sql)
 
-    print("  - UNESCO by country summary")
-    unesco_by_country_df = load_unesco_by_country_data()
 
-    print("  - Tarot Travel Database")
-    tarot_df = load_tarot_travel_database()
+# ======================================================================
+# Main: create unified SQLite database
+# ======================================================================
 
-    print("  - Unsplash country pictures")
-    pictures_df = load_pictures_data()
+def create_unified_database(output_db: str = "unified_country_database.db"):
+    """Create a unified SQLite database from all data sources."""
 
-    print("  - Airports data")
-    airports_df = load_airports_data()
-    if not airports_df.empty:
-        # 1. Sort so that rows with page_rank values come first (NaNs go to the bottom)
-        airports_df = airports_df.sort_values(by='page_rank', ascending=False)
-        
-        # 2. Now drop duplicates, keeping the first (the one with the rank)
-        airports_df = airports_df.drop_duplicates(subset=['iata_code'], keep='first')
+    print("\n" + "=" * 60)
+    print("UNIFIED COUNTRY DATABASE CREATOR - FIXED")
+    print("=" * 60)
+    print("\nLoading data sources...")
 
-    print("  - Flight network data")
-    flight_costs_df = load_flight_network_data(airports_df)
+    print("  - ISO country codes (base table)")
+    iso_df = load_iso_codes()
 
-    print("  - Equality Index data")
-    equality_index_df = load_equality_index_data()
+    # The remaining loaders run concurrently (parsing in C releases the GIL
+    # for part of the time); the Equality Index reuses iso_df for
+    # its ISO2 -> ISO3 mapping, the flight network is chained after the
+    # airports inside its own job.
+    loaders = [
+        ("pli", "PLI (Price Level Index) data", load_pli_data),
+        ("exchange", "Exchange rate data", load_exchange_data),
+        (
+            "tugo",
+            "TuGo travel warnings with details",
+            load_tugo_travel_warnings_with_details,
+        ),
+        ("fo", "Foreign Office travel warnings", load_foreign_office_travel_warnings),
+        ("climate", "Climate data", load_climate_data),
+        ("unesco", "UNESCO World Heritage Sites", load_unesco_heritage_data),
+        ("numbeo_countries", "Numbeo countries", load_numbeo_countries),
+        ("numbeo_prices", "Numbeo prices", load_numbeo_prices),
+        ("numbeo_exchange", "Numbeo exchange rates", load_numbeo_exchange_rates),
+        ("numbeo_indices", "Numbeo indices", load_numbeo_indices),
+        ("unesco_by_country", "UNESCO by country summary", load_unesco_by_country_data),
+        ("tarot", "Tarot Travel Database", load_tarot_travel_database),
+        ("pictures", "Unsplash country pictures", load_pictures_data),
+        ("airports", "Airports + flight network data", load_airports_and_flight_network),
+        (
+            "equality_index",
+            "Equality Index data",
+            functools.partial(load_equality_index_data, iso_df),
+        ),
+    ]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        futures = {}
+        for key, label, loader in loaders:
+            print(f"  - {label}")
+            futures[key] = executor.submit(loader)
+    results = {key: future.result() for key, future in futures.items()}
+
+    pli_df = results["pli"]
+    exchange_df = results["exchange"]
+    tugo_summary_df, tugo_detail_tables = results["tugo"]
+    fo_df = results["fo"]
+    climate_df = results["climate"]
+    unesco_df = results["unesco"]
+    numbeo_countries_df = results["numbeo_countries"]
+    numbeo_prices_df = results["numbeo_prices"]
+    numbeo_exchange_df = results["numbeo_exchange"]
+    numbeo_indices_df = results["numbeo_indices"]
+    unesco_by_country_df = results["unesco_by_country"]
+    tarot_df = results["tarot"]
+    pictures_df = results["pictures"]
+    airports_df, hubs_df, flight_costs_df = results["airports"]
+    equality_index_df = results["equality_index"]
 
     # ------------------------------------------------------------------
     # Merge everything on iso3 for main "countries" table
     # ------------------------------------------------------------------
     print("\nMerging datasets on ISO3 country codes...")
 
-    unified_df = iso_df.copy()
-    unified_df = unified_df.join(pli_df, how="left")
-    unified_df = unified_df.join(exchange_df, how="left")
-
-    if not tugo_summary_df.empty:
-        unified_df = unified_df.join(tugo_summary_df, how="left")
-
-    if not fo_df.empty:
-        unified_df = unified_df.join(fo_df, how="left")
-
-    if not pictures_df.empty:
-        unified_df = unified_df.join(pictures_df, how="left")
-
-    if not numbeo_countries_df.empty:
-        unified_df = unified_df.join(numbeo_countries_df, how="left")
-
-    if not numbeo_indices_df.empty:
-        unified_df = unified_df.join(numbeo_indices_df, how="left")
-
-    if not equality_index_df.empty:
-        unified_df = unified_df.join(equality_index_df, how="left")
+    # Align every source to the iso_df rows (one row per key, so nothing can
+    # fan out) and glue them together in a single concat instead of a chain
+    # of joins that each allocate a new frame. Sources keyed by iso2 (TuGo)
+    # are looked up through iso_df's iso2 column.
+    # Where a source repeats a key (Numbeo lists Alderney and Guernsey both
+    # as GGY), the row whose name column matches iso_df's country_name wins.
+    sources = [
+        ("PLI", pli_df, None),
+        ("Exchange rates", exchange_df, None),
+        ("TuGo", tugo_summary_df, None),
+        ("Foreign Office", fo_df, None),
+        ("Pictures", pictures_df, None),
+        ("Numbeo countries", numbeo_countries_df, "numbeo_country_name"),
+        ("Numbeo indices", numbeo_indices_df, "numbeo_country_name_indices"),
+        ("Equality Index", equality_index_df, None),
+    ]
+    frames = [iso_df]
+    for source, df, name_col in sources:
+        if not df.empty:
+            key = df.index.name
+            labels = iso_df.index if key == "iso3" else iso_df[key]
+            names = pd.Series(iso_df["country_name"].to_numpy(), index=labels)
+            aligned = (
+                one_row_per_key(df, source, names, name_col)
+                .reindex(labels)
+                .set_axis(iso_df.index)
+            )
+            frames.append(aligned)
+    unified_df = pd.concat(frames, axis=1, copy=False)
 
     unified_df = unified_df.reset_index()
 
@@ -844,40 +1254,49 @@ def create_unified_database(output_db: str = "unified_country_database.db"):
 
     print(f"\nSaving to SQLite: {db_path}")
     conn = sqlite3.connect(str(db_path))
+    conn.executescript(SQLITE_BULK_LOAD_PRAGMAS)
     cursor = conn.cursor()
 
+    # One transaction for all tables and indexes (sqlite3 would otherwise
+    # autocommit each DROP/CREATE); committed after the indexes below
+    cursor.execute("BEGIN")
+
     # Main table
-    unified_df.to_sql("countries", conn, if_exists="replace", index=False)
+    write_table(unified_df, "countries", conn)
     print(f"  [OK] 'countries' table: {len(unified_df)} rows")
 
     # Climate table
-    climate_df.to_sql("climate_monthly", conn, if_exists="replace", index=False)
+    write_table(climate_df, "climate_monthly", conn)
     print(f"  [OK] 'climate_monthly' table: {len(climate_df)} rows")
 
     # UNESCO tables
     if not unesco_df.empty:
-        unesco_df.to_sql("unesco_heritage_sites", conn, if_exists="replace", index=False)
+        write_table(unesco_df, "unesco_heritage_sites", conn)
         print(f"  [OK] 'unesco_heritage_sites' table: {len(unesco_df)} rows")
     else:
         print("  [INFO] 'unesco_heritage_sites' table skipped (no data).")
 
     if not unesco_by_country_df.empty:
-        unesco_by_country_df.to_sql(
-            "unesco_by_country", conn, if_exists="replace", index=False
-        )
+        write_table(unesco_by_country_df, "unesco_by_country", conn)
         print(f"  [OK] 'unesco_by_country' table: {len(unesco_by_country_df)} rows")
     else:
         print("  [INFO] 'unesco_by_country' table skipped (no data).")
 
     # Airports and flights
     if not airports_df.empty:
-        airports_df.to_sql("airports", conn, if_exists="replace", index=False)
+        write_table(airports_df, "airports", conn)
         print(f"  [OK] 'airports' table: {len(airports_df)} rows")
     else:
         print("  [INFO] 'airports' table skipped (no data).")
 
+    if not hubs_df.empty:
+        write_table(hubs_df, "airport_hubs", conn)
+        print(f"  [OK] 'airport_hubs' table: {len(hubs_df)} rows")
+    else:
+        print("  [INFO] 'airport_hubs' table skipped (no data).")
+
     if not flight_costs_df.empty:
-        flight_costs_df.to_sql("flight_costs", conn, if_exists="replace", index=False)
+        write_table(flight_costs_df, "flight_costs", conn)
         print(f"  [OK] 'flight_costs' table: {len(flight_costs_df)} rows")
     else:
         print("  [INFO] 'flight_costs' table skipped (no data).")
@@ -885,7 +1304,7 @@ def create_unified_database(output_db: str = "unified_country_database.db"):
     
         # Tarot Travel Database
     if not tarot_df.empty:
-        tarot_df.to_sql("tarot_countries", conn, if_exists="replace", index=False)
+        write_table(tarot_df, "tarot_countries", conn)
         print(f"  [OK] 'tarot_countries' table: {len(tarot_df)} rows")
     else:
         print("  [INFO] 'tarot_countries' table skipped (no data).")
@@ -893,17 +1312,17 @@ def create_unified_database(output_db: str = "unified_country_database.db"):
 
     # Numbeo tables
     if not numbeo_prices_df.empty:
-        numbeo_prices_df.to_sql("numbeo_prices", conn, if_exists="replace", index=False)
+        write_table(numbeo_prices_df, "numbeo_prices", conn)
         print(f"  [OK] 'numbeo_prices' table: {len(numbeo_prices_df)} rows")
 
         # Derive numbeo_items (item_id -> item_name)
         if {"item_id", "item_name"}.issubset(numbeo_prices_df.columns):
-            numbeo_items_df = (
-                numbeo_prices_df[["item_id", "item_name"]]
-                .drop_duplicates(subset=["item_id"])
-                .sort_values("item_id")
-            )
-            numbeo_items_df.to_sql("numbeo_items", conn, if_exists="replace", index=False)
+            # Dedup and sort in one factorize pass; first() skips a missing
+            # item_name when a later row of the same item has one
+            numbeo_items_df = numbeo_prices_df.groupby(
+                "item_id", sort=True, dropna=False, as_index=False
+            )["item_name"].first()
+            write_table(numbeo_items_df, "numbeo_items", conn)
             print(f"  [OK] 'numbeo_items' table: {len(numbeo_items_df)} rows")
         else:
             print("  [INFO] 'numbeo_items' table skipped (no item_id/item_name).")
@@ -911,31 +1330,27 @@ def create_unified_database(output_db: str = "unified_country_database.db"):
         print("  [INFO] 'numbeo_prices' table skipped (no data).")
 
     if not numbeo_exchange_df.empty:
-        numbeo_exchange_df.reset_index().to_sql(
-            "numbeo_exchange_rates", conn, if_exists="replace", index=False
-        )
+        write_table(numbeo_exchange_df.reset_index(), "numbeo_exchange_rates", conn)
         print(f"  [OK] 'numbeo_exchange_rates' table: {len(numbeo_exchange_df)} rows")
     else:
         print("  [INFO] 'numbeo_exchange_rates' table skipped (no data).")
 
     if not numbeo_indices_df.empty:
-        numbeo_indices_df.reset_index().to_sql(
-            "numbeo_indices", conn, if_exists="replace", index=False
-        )
+        write_table(numbeo_indices_df.reset_index(), "numbeo_indices", conn)
         print(f"  [OK] 'numbeo_indices' table: {len(numbeo_indices_df)} rows")
     else:
         print("  [INFO] 'numbeo_indices' table skipped (no data).")
 
     # TuGo detail tables
-    if tugo_detail_dfs:
-        for table_name, df in tugo_detail_dfs.items():
-            if not df.empty:
-                df.to_sql(table_name, conn, if_exists="replace", index=False)
-                print(f"  [OK] '{table_name}' table: {len(df)} rows")
+    if tugo_detail_tables:
+        for table_name, columns in tugo_detail_tables.items():
+            if columns["iso2"]:
+                write_text_columns(columns, table_name, conn)
+                print(f"  [OK] '{table_name}' table: {len(columns['iso2'])} rows")
 
     # Equality Index table
     if not equality_index_df.empty:
-        equality_index_df.reset_index().to_sql("equality_index", conn, if_exists="replace", index=False)
+        write_table(equality_index_df.reset_index(), "equality_index", conn)
         print(f"  [OK] 'equality_index' table: {len(equality_index_df)} rows")
     else:  
         print("  [INFO] 'equality_index' table skipped (no data).")
@@ -943,131 +1358,17 @@ def create_unified_database(output_db: str = "unified_country_database.db"):
 
 
     # ------------------------------------------------------------------
-    # Create indexes (only if table exists)
+    # Create indexes (after every table is loaded, same transaction)
     # ------------------------------------------------------------------
-    existing_tables = {
-        row[0]
-        for row in cursor.execute(
-            "SELECT name FROM sqlite_master WHERE type='table'"
-        ).fetchall()
-    }
-
-    def create_index_if_table_exists(sql: str, table_name: str):
-        if table_name in existing_tables:
-            cursor.execute(sql)
-
-    create_index_if_table_exists(
-        "CREATE INDEX IF NOT EXISTS idx_countries_iso3 ON countries(iso3)",
-        "countries",
-    )
-    create_index_if_table_exists(
-        "CREATE INDEX IF NOT EXISTS idx_climate_country ON climate_monthly(country_name_climate)",
-        "climate_monthly",
-    )
-
-    # TuGo detail tables (iso2)
-    create_index_if_table_exists(
-        "CREATE INDEX IF NOT EXISTS idx_tugo_climate_iso2 ON tugo_climate(iso2)",
-        "tugo_climate",
-    )
-    create_index_if_table_exists(
-        "CREATE INDEX IF NOT EXISTS idx_tugo_health_iso2 ON tugo_health(iso2)",
-        "tugo_health",
-    )
-    create_index_if_table_exists(
-        "CREATE INDEX IF NOT EXISTS idx_tugo_safety_iso2 ON tugo_safety(iso2)",
-        "tugo_safety",
-    )
-    create_index_if_table_exists(
-        "CREATE INDEX IF NOT EXISTS idx_tugo_laws_iso2 ON tugo_laws(iso2)",
-        "tugo_laws",
-    )
-    create_index_if_table_exists(
-        "CREATE INDEX IF NOT EXISTS idx_tugo_entry_iso2 ON tugo_entry(iso2)",
-        "tugo_entry",
-    )
-    create_index_if_table_exists(
-        "CREATE INDEX IF NOT EXISTS idx_tugo_offices_iso2 ON tugo_offices(iso2)",
-        "tugo_offices",
-    )
-
-    # UNESCO
-    create_index_if_table_exists(
-        "CREATE INDEX IF NOT EXISTS idx_unesco_country_iso ON unesco_heritage_sites(country_iso)",
-        "unesco_heritage_sites",
-    )
-    create_index_if_table_exists(
-        "CREATE INDEX IF NOT EXISTS idx_unesco_id ON unesco_heritage_sites(id)",
-        "unesco_heritage_sites",
-    )
-    create_index_if_table_exists(
-        "CREATE INDEX IF NOT EXISTS idx_unesco_by_country_iso_code ON unesco_by_country(iso_code)",
-        "unesco_by_country",
-    )
-
-    # Airports / flights
-    create_index_if_table_exists(
-        "CREATE UNIQUE INDEX IF NOT EXISTS idx_airports_iata ON airports(iata_code)",
-        "airports",
-    )
-    create_index_if_table_exists(
-        "CREATE INDEX IF NOT EXISTS idx_airports_iso2 ON airports(iso2)",
-        "airports",
-    )
-    create_index_if_table_exists(
-        "CREATE INDEX IF NOT EXISTS idx_flights_origin ON flight_costs(origin)",
-        "flight_costs",
-    )
-    create_index_if_table_exists(
-        "CREATE INDEX IF NOT EXISTS idx_flights_dest ON flight_costs(destination)",
-        "flight_costs",
-    )
-
-    # Numbeo
-    create_index_if_table_exists(
-        "CREATE INDEX IF NOT EXISTS idx_numbeo_prices_iso3 ON numbeo_prices(iso3)",
-        "numbeo_prices",
-    )
-    create_index_if_table_exists(
-        "CREATE INDEX IF NOT EXISTS idx_numbeo_prices_item ON numbeo_prices(item_id)",
-        "numbeo_prices",
-    )
-    create_index_if_table_exists(
-        "CREATE INDEX IF NOT EXISTS idx_numbeo_items_id ON numbeo_items(item_id)",
-        "numbeo_items",
-    )
-    create_index_if_table_exists(
-        "CREATE INDEX IF NOT EXISTS idx_numbeo_exrates_currency ON numbeo_exchange_rates(currency)",
-        "numbeo_exchange_rates",
-    )
-    create_index_if_table_exists(
-        "CREATE INDEX IF NOT EXISTS idx_numbeo_indices_iso3 ON numbeo_indices(iso3)",
-        "numbeo_indices",
-    )
-
-        # Tarot
-    create_index_if_table_exists(
-        "CREATE INDEX IF NOT EXISTS idx_tarot_country_code ON tarot_countries(country_code)",
-        "tarot_countries",
-    )
-    create_index_if_table_exists(
-        "CREATE INDEX IF NOT EXISTS idx_tarot_card_name ON tarot_countries(card_name)",
-        "tarot_countries",
-    )
-    create_index_if_table_exists(
-        "CREATE INDEX IF NOT EXISTS idx_tarot_orientation ON tarot_countries(orientation)",
-        "tarot_countries",
-    )
-
-    #Equality Index
-    create_index_if_table_exists( 
-        "CREATE INDEX IF NOT EXISTS idx_equality_index_iso3 ON equality_index(iso3)", 
-        "equality_index", 
-    )
+    build_indexes(conn)
 
     conn.commit()
     print("  [OK] Indexes created")
 
+    # Gather index statistics for the query planner (sqlite_stat1)
+    cursor.execute("ANALYZE")
+    conn.commit()
+
     # ------------------------------------------------------------------
     # Summary
     # ------------------------------------------------------------------
@@ -1084,12 +1385,14 @@ def create_unified_database(output_db: str = "unified_country_database.db"):
         print(f"  - unesco_by_country ({len(unesco_by_country_df)} rows)")
     if not airports_df.empty:
         print(f"  - airports ({len(airports_df)} rows)")
+    if not hubs_df.empty:
+        print(f"  - airport_hubs ({len(hubs_df)} rows)")
     if not flight_costs_df.empty:
         print(f"  - flight_costs ({len(flight_costs_df)} rows)")
-    if tugo_detail_dfs:
-        for table_name, df in tugo_detail_dfs.items():
-            if not df.empty:
-                print(f"  - {table_name} ({len(df)} rows)")
+    if tugo_detail_tables:
+        for table_name, columns in tugo_detail_tables.items():
+            if columns["iso2"]:
+                print(f"  - {table_name} ({len(columns['iso2'])} rows)")
     if not numbeo_prices_df.empty:
         print(f"  - numbeo_prices ({len(numbeo_prices_df)} rows)")
     if not numbeo_exchange_df.empty:
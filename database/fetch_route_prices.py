@@ -2,35 +2,121 @@ import pandas as pd
 import os
 import datetime
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from dotenv import load_dotenv
 
 # Assumes amadeus_api_client is now in the same 'database' folder
 import amadeus_api_client as amadeus
 
-def get_flight_network_data(airports_df):
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pyarrow  # noqa: F401  (Parquet cache)
+
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# Amadeus Self-Service quota: the test environment allows 10 transactions per
+# second per API key. The default of 4/s stays well under that and leaves room
+# for the app's live flight searches, which share the key. Override it with
+# AMADEUS_MAX_REQUESTS_PER_SECOND in .env. One full run makes about two
+# requests per country hub.
+MAX_REQUESTS_PER_SECOND = 4
+# Keep only as many requests in flight as the rate can use
+MAX_WORKERS = 8
+# Rate-limited (429) searches are retried after Retry-After, or after an
+# exponential backoff starting at RETRY_BASE_DELAY seconds
+MAX_RETRIES = 3
+RETRY_BASE_DELAY = 2.0
+
+
+class RateLimiter:
+    """Spaces calls from any number of threads to at most `rate` per second."""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate
+        self.lock = threading.Lock()
+        self.next_slot = time.monotonic()
+
+    def wait(self):
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot)
+            self.next_slot = slot + self.interval
+        time.sleep(max(0.0, slot - now))
+
+    def pause(self, seconds):
+        """Hold back every thread's next call, e.g. after a 429."""
+        with self.lock:
+            self.next_slot = max(self.next_slot, time.monotonic() + seconds)
+
+
+def write_parquet_cache(df, path):
+    """Best-effort write of the derived Parquet cache; the JSON stays authoritative."""
+    if not HAS_PYARROW:
+        return
+    try:
+        df.to_parquet(path, index=False)
+    except Exception as e:
+        print(f"  ⚠️ Could not write Parquet cache {path}: {e}")
+
+
+def get_flight_network_data(hubs_df):
     """
     Generates flight prices from US/DE to all other countries.
     
+    hubs_df holds the single busiest airport of every country (one row per
+    iso2, built once by database_final alongside the airports table).
+
     Logic:
-    1. Selects the single busiest airport for every country in the dataset.
-    2. Uses the busiest US airport and busiest DE airport as origins.
-    3. Fetches flight prices to all other identified major airports.
+    1. Uses the US and DE hubs as origins.
+    2. Fetches flight prices to all other country hubs.
     """
     # 1. Setup Paths
     script_dir = Path(__file__).parent
     data_dir = script_dir / "data"
     data_dir.mkdir(exist_ok=True)
     
-    cache_file = data_dir / "flight_network_data.json"
+    # The committed JSON is the source of truth. The Parquet file is a derived,
+    # gitignored local copy (binary, no JSON parsing on reload) that is only
+    # used while it is at least as new as the JSON
+    parquet_cache_file = data_dir / "flight_network_data.parquet"
+    json_cache_file = data_dir / "flight_network_data.json"
 
     # 2. Check Cache
-    if cache_file.exists():
-        print(f"  Using cached flight network data from {cache_file}")
+    parquet_fresh = (
+        HAS_PYARROW
+        and parquet_cache_file.exists()
+        and (
+            not json_cache_file.exists()
+            or parquet_cache_file.stat().st_mtime >= json_cache_file.stat().st_mtime
+        )
+    )
+    if parquet_fresh:
+        print(f"  Using cached flight network data from {parquet_cache_file}")
+        try:
+            return pd.read_parquet(parquet_cache_file, memory_map=True)
+        except Exception:
+            print("  ⚠️ Error reading cached Parquet. Trying JSON cache...")
+
+    if json_cache_file.exists():
+        print(f"  Using cached flight network data from {json_cache_file}")
         try:
-            return pd.read_json(cache_file)
+            if orjson is not None:
+                df_cached = pd.DataFrame(orjson.loads(json_cache_file.read_bytes()))
+            else:
+                df_cached = pd.read_json(json_cache_file)
         except ValueError:
             print("  ⚠️ Error reading cached JSON. Re-fetching data...")
+        else:
+            write_parquet_cache(df_cached, parquet_cache_file)
+            return df_cached
 
     print("  Cache not found. Fetching live flight prices (this takes ~2-3 mins)...")
 
@@ -46,11 +132,8 @@ def get_flight_network_data(airports_df):
 
     # 4. Define Origins and Destinations
     try:
-        # Filter: Group by Country (iso2) and take the single airport with highest passenger_volume
-        # This ensures we have exactly one destination per country (approx 200 total)
-        top_airports_per_country = airports_df.sort_values(
-            by='passenger_volume', ascending=False
-        ).groupby('iso2').head(1)
+        # Exactly one destination per country (approx 200 total)
+        top_airports_per_country = hubs_df
 
         print(f"  Identified {len(top_airports_per_country)} major country hubs.")
 
@@ -97,14 +180,57 @@ def get_flight_network_data(airports_df):
     departure_date = today + datetime.timedelta(days=90)
     return_date = departure_date + datetime.timedelta(days=7)
 
-    results = []
-    
-    # 8. Fetch Data
-    for i, (origin, destination) in enumerate(routes):
-        # Print progress every 10 requests
-        if i % 10 == 0:
-            print(f"  Fetching route {i+1}/{total_routes}...", end="\r")
+    # 8. Fetch Data (in parallel, paced by the rate limiter instead of a
+    # fixed sleep after every request)
+    limiter = RateLimiter(float(os.getenv("AMADEUS_MAX_REQUESTS_PER_SECOND", MAX_REQUESTS_PER_SECOND)))
+    token_lock = threading.Lock()
+    auth = {"token": token}
+
+    def search(params):
+        """Run one search; refreshes the token on 401 and backs off on 429."""
+        refreshed = False
+        for attempt in range(MAX_RETRIES + 1):
+            limiter.wait()
+            used_token = auth["token"]
+            response = amadeus.search_flight_offers_response(used_token, params)
 
+            if response.status_code == 401 and not refreshed:
+                # Token expired: only the first thread to notice refreshes,
+                # the others reuse the new token
+                with token_lock:
+                    if auth["token"] == used_token:
+                        new_token = amadeus.get_amadeus_access_token(AMADEUS_API_KEY, AMADEUS_API_SECRET)
+                        if new_token:
+                            auth["token"] = new_token
+                refreshed = True
+                continue
+
+            if response.status_code == 429 and attempt < MAX_RETRIES:
+                # A new token does not lift a rate limit; all threads wait
+                # before the next request
+                try:
+                    delay = float(response.headers.get("Retry-After", ""))
+                except ValueError:
+                    delay = RETRY_BASE_DELAY * 2 ** attempt
+                limiter.pause(delay)
+                continue
+
+            if not response.ok:
+                # Bad IATA codes, dates etc. only show up here
+                try:
+                    detail = response.json().get("errors", response.text)
+                except ValueError:
+                    detail = response.text
+                print(
+                    f"\n  [API Error {response.status_code}] "
+                    f"{params['originLocationCode']}->{params['destinationLocationCode']}: {detail}"
+                )
+                return None
+            return response.json()
+        return None
+
+    def fetch_route(route):
+        origin, destination = route
         params = {
             "originLocationCode": origin,
             "destinationLocationCode": destination,
@@ -117,12 +243,7 @@ def get_flight_network_data(airports_df):
         }
 
         try:
-            response = amadeus.search_flight_offers(token, params)
-
-            if response is None:
-                # Refresh token if it expired (401) or a rate limit (429) occurred
-                token = amadeus.get_amadeus_access_token(AMADEUS_API_KEY, AMADEUS_API_SECRET)
-                response = amadeus.search_flight_offers(token, params)
+            response = search(params)
             
             if response and 'data' in response and len(response['data']) > 0:
                 cheapest = response['data'][0]
@@ -132,25 +253,37 @@ def get_flight_network_data(airports_df):
                 stops_outbound = len(itineraries[0]['segments']) - 1 if itineraries else 0
                 is_direct = (stops_outbound == 0)
                 
-                results.append({
+                return {
                     "origin": origin,
                     "destination": destination,
                     "price_eur": price,
                     "is_direct": is_direct,
                     "stops": stops_outbound
-                })
+                }
         except Exception:
             pass # Skip errors/timeouts to keep moving
-        
-        time.sleep(5) # Rate limit
+        return None
+
+    results = []
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        # map() yields in route order, so results keep the original ordering
+        for i, result in enumerate(executor.map(fetch_route, routes)):
+            # Print progress every 10 requests
+            if i % 10 == 0:
+                print(f"  Fetching route {i+1}/{total_routes}...", end="\r")
+            if result is not None:
+                results.append(result)
 
     print(f"  Fetch complete. Found prices for {len(results)} routes.")
 
     # 9. Save and Return
     df_results = pd.DataFrame(results)
     if not df_results.empty:
-        # Save as JSON
-        df_results.to_json(cache_file, orient='records', indent=4)
-        print(f"  ✅ Flight data cached to {cache_file}")
+        # Always pandas' 4-space layout, so the committed file does not churn
+        # depending on whether orjson is installed
+        df_results.to_json(json_cache_file, orient='records', indent=4)
+        print(f"  ✅ Flight data cached to {json_cache_file}")
+        # Written after the JSON so its mtime marks it as current
+        write_parquet_cache(df_results, parquet_cache_file)
     
     return df_results
\ No newline at end of file
@@ -11,10 +11,18 @@ Fields per row:
 
 from __future__ import annotations
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 BASE_API = "https://www.auswaertiges-amt.de/opendata"
@@ -23,6 +31,15 @@ BASE_API = "https://www.auswaertiges-amt.de/opendata"
 SCRIPT_DIR = Path(__file__).parent
 DATA_DIR = SCRIPT_DIR / "data"
 OUT_PATH = DATA_DIR / "foreign_office_travelwarnings.json"
+# Rows are appended here as they arrive, so an interrupted run can resume
+PARTIAL_PATH = OUT_PATH.with_suffix(".ndjson")
+# Only resume from a partial file written this recently; anything older belongs
+# to an earlier run and would mix stale advisories into the output
+PARTIAL_MAX_AGE_SECONDS = 6 * 3600
+
+# Detail requests are latency-bound, so they are fetched in parallel; the
+# session's connection pool is sized to match
+MAX_WORKERS = 16
 
 
 S = requests.Session()
@@ -30,6 +47,7 @@ S.headers.update({
     "Accept": "application/json, text/plain, */*",
     "User-Agent": "aa-travelwarning-minimal/0.3",
 })
+S.mount("https://", HTTPAdapter(pool_connections=MAX_WORKERS, pool_maxsize=MAX_WORKERS))
 
 
 def ts_iso(ts: Optional[int]) -> Optional[str]:
@@ -48,9 +66,78 @@ def get_json(path: str, timeout: int = 30) -> Any:
     if r.is_redirect or r.status_code in (301, 302, 303, 307, 308):
         raise RuntimeError(f"redirected: {url} -> {r.headers.get('Location','')}")
     r.raise_for_status()
+    if orjson is not None:
+        return orjson.loads(r.content)
     return r.json()
 
 
+def fetch_detail(cid: str) -> Tuple[Optional[Dict[str, Any]], Optional[Exception]]:
+    """Fetch one travel warning; returns (detail, None) or (None, error)."""
+    try:
+        return get_json(f"/travelwarning/{cid}"), None
+    except Exception as e:
+        return None, e
+
+
+def build_row(cid: str, meta: Dict[str, Any], detail: Dict[str, Any]) -> Dict[str, Any]:
+    """Combine a detail payload with its list entry into one output row."""
+    country_name = (
+        detail.get("countryName") or detail.get("country") or 
+        detail.get("state") or meta.get("countryName")
+    )
+    country_code = detail.get("countryCode") or meta.get("countryCode")
+    iso3 = detail.get("iso3CountryCode") or meta.get("iso3CountryCode")
+    title = detail.get("title") or detail.get("name") or meta.get("title")
+    last_mod = ts_iso(detail.get("lastModified") or meta.get("lastModified"))
+    effective = ts_iso(detail.get("effective"))
+    warning = int(bool(detail.get("warning", meta.get("warning", False))))
+    partial_warning = int(bool(detail.get("partialWarning", 
+                                           meta.get("partialWarning", False))))
+    situation_warning = int(bool(detail.get("situationWarning", 
+                                             meta.get("situationWarning", False))))
+    situation_part_warning = int(bool(detail.get("situationPartWarning", 
+                                                  meta.get("situationPartWarning", False))))
+
+    try:
+        cid_for_row = int(cid)
+    except Exception:
+        cid_for_row = cid
+
+    return {
+        "content_id": cid_for_row,
+        "title": title,
+        "country_name": country_name,
+        "country_code": country_code,
+        "iso3_country_code": iso3,
+        "last_modified_iso": last_mod,
+        "effective_iso": effective,
+        "warning": warning,
+        "partial_warning": partial_warning,
+        "situation_warning": situation_warning,
+        "situation_part_warning": situation_part_warning,
+    }
+
+
+def load_partial() -> Dict[str, Dict[str, Any]]:
+    """Rows saved by an interrupted run, keyed by content id."""
+    done: Dict[str, Dict[str, Any]] = {}
+    if not PARTIAL_PATH.exists():
+        return done
+    age = time.time() - PARTIAL_PATH.stat().st_mtime
+    if age > PARTIAL_MAX_AGE_SECONDS:
+        print(f"Discarding {PARTIAL_PATH.name}: {age / 3600:.1f} h old, from an earlier run")
+        PARTIAL_PATH.unlink(missing_ok=True)
+        return done
+    with open(PARTIAL_PATH, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # line cut off by the interruption; refetched below
+            done[str(row["content_id"])] = row
+    return done
+
+
 def collect(limit: Optional[int] = None) -> List[Dict[str, Any]]:
     root = get_json("/travelwarning")
     if not isinstance(root, dict) or "response" not in root:
@@ -63,59 +150,39 @@ def collect(limit: Optional[int] = None) -> List[Dict[str, Any]]:
     if limit:
         items = items[:limit]
 
-    rows: List[Dict[str, Any]] = []
-    total = len(items)
-
-    for idx, (cid, meta) in enumerate(items, 1):
-        print(f"[{idx:3d}/{total}] Fetching {cid}...", end=' ', flush=True)
-        try:
-            detail = get_json(f"/travelwarning/{cid}")
-            print("OK")
-        except Exception as e:
-            print(f"FAILED {e}")
-            continue
-
-        country_name = (
-            detail.get("countryName") or detail.get("country") or 
-            detail.get("state") or meta.get("countryName")
-        )
-        country_code = detail.get("countryCode") or meta.get("countryCode")
-        iso3 = detail.get("iso3CountryCode") or meta.get("iso3CountryCode")
-        title = detail.get("title") or detail.get("name") or meta.get("title")
-        last_mod = ts_iso(detail.get("lastModified") or meta.get("lastModified"))
-        effective = ts_iso(detail.get("effective"))
-        warning = int(bool(detail.get("warning", meta.get("warning", False))))
-        partial_warning = int(bool(detail.get("partialWarning", 
-                                               meta.get("partialWarning", False))))
-        situation_warning = int(bool(detail.get("situationWarning", 
-                                                 meta.get("situationWarning", False))))
-        situation_part_warning = int(bool(detail.get("situationPartWarning", 
-                                                      meta.get("situationPartWarning", False))))
-
-        try:
-            cid_for_row = int(cid)
-        except Exception:
-            cid_for_row = cid
-
-        rows.append({
-            "content_id": cid_for_row,
-            "title": title,
-            "country_name": country_name,
-            "country_code": country_code,
-            "iso3_country_code": iso3,
-            "last_modified_iso": last_mod,
-            "effective_iso": effective,
-            "warning": warning,
-            "partial_warning": partial_warning,
-            "situation_warning": situation_warning,
-            "situation_part_warning": situation_part_warning,
-        })
+    done = load_partial()
+    if done:
+        print(f"Resuming: {len(done)} rows already saved in {PARTIAL_PATH.name}")
+    pending = [(cid, meta) for cid, meta in items if cid not in done]
+    total = len(pending)
+
+    # map() yields in submission order, so progress prints and partial
+    # writes stay sequential (no lock needed)
+    if pending:
+        with open(PARTIAL_PATH, "a", encoding="utf-8") as partial, \
+                ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            results = executor.map(fetch_detail, [cid for cid, _ in pending])
+            for idx, ((cid, meta), (detail, error)) in enumerate(zip(pending, results), 1):
+                if error is not None:
+                    print(f"[{idx:3d}/{total}] Fetching {cid}... FAILED {error}")
+                    continue
+                print(f"[{idx:3d}/{total}] Fetching {cid}... OK")
+                row = build_row(cid, meta, detail)
+                done[cid] = row
+                partial.write(json.dumps(row, ensure_ascii=False) + "\n")
+                partial.flush()
+
+    rows: List[Dict[str, Any]] = [done[cid] for cid, _ in items if cid in done]
 
     print("\n" + "="*60)
     print(f"Saving {len(rows)} rows...")
 
-    with open(OUT_PATH, "w", encoding="utf-8") as f:
-        json.dump(rows, f, ensure_ascii=False, indent=2)
+    if orjson is not None:
+        OUT_PATH.write_bytes(orjson.dumps(rows, option=orjson.OPT_INDENT_2))
+    else:
+        with open(OUT_PATH, "w", encoding="utf-8") as f:
+            json.dump(rows, f, ensure_ascii=False, indent=2)
+    PARTIAL_PATH.unlink(missing_ok=True)
 
     print(f" Saved to: {OUT_PATH}")
     print(f"File size: {OUT_PATH.stat().st_size / 1024:.2f} KB")
@@ -2,180 +2,82 @@
 import streamlit as st
 import os
 import datetime
+import string
+import textwrap
+from functools import lru_cache
 
 
-def _section_title(title: str, subtitle: str = ""):
-    st.markdown(
-        f"""
-        <div style="
-            margin-top: 0.25rem;
-            padding: 18px 18px 14px 18px;
-            border-radius: 16px;
-            background: rgba(15, 20, 40, 0.35);
-            border: 1px solid rgba(255, 255, 255, 0.12);
-            backdrop-filter: blur(18px);
-            box-shadow: 0 10px 30px rgba(0,0,0,0.25);
-        ">
-            <div style="font-size:1.9rem; font-weight:800; letter-spacing:-0.5px;">
-                {title}
-            </div>
-            {f"<div style='margin-top:6px; color: rgba(255,255,255,0.78); font-size:1.05rem; line-height:1.4;'>{subtitle}</div>" if subtitle else ""}
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
+# The helpers below return HTML strings instead of rendering them, so that
+# consecutive fragments in one container go out as a single st.markdown call
+# (each call is a separate message to the browser). Fragments are dedented:
+# inside a combined Markdown body, indented lines would turn into code blocks.
+# The page content is static, so the string builders are memoized and reruns
+# only re-send the cached strings.
+
 
+def _render(*parts: str):
+    """Render HTML/Markdown fragments with one st.markdown call."""
+    st.markdown("\n\n".join(parts), unsafe_allow_html=True)
 
-def _mini_card(title: str, body_html: str):
+
+def _spacer(height_px: int) -> str:
+    return f"<div style='height:{height_px}px;'></div>"
+
+
+# Card styling lives in _ABOUT_CSS; the templates only carry class names.
+_SECTION_TPL = string.Template(
+    "<div class='pf-section'><div class='pf-section-title'>$title</div><div class='pf-section-sub'>$subtitle</div></div>"
+)
+_SECTION_TPL_NOSUB = string.Template("<div class='pf-section'><div class='pf-section-title'>$title</div></div>")
+_MINI_CARD_TPL = string.Template(
+    "<div class='pf-mini'><div class='pf-mini-title'>$title</div><div class='pf-mini-body'>$body_html</div></div>"
+)
+
+
+@lru_cache(maxsize=None)
+def _section_title_html(title: str, subtitle: str = "") -> str:
+    if subtitle:
+        return _SECTION_TPL.substitute(title=title, subtitle=subtitle)
+    return _SECTION_TPL_NOSUB.substitute(title=title)
+
+
+@lru_cache(maxsize=None)
+def _mini_card_html(title: str, body_html: str) -> str:
     # IMPORTANT: body_html should be HTML (not markdown) to avoid the </div> artifact.
-    st.markdown(
-        f"""
-        <div style="
-            border-radius: 16px;
-            padding: 16px 16px 14px 16px;
-            background: rgba(25, 35, 55, 0.45);
-            border: 1px solid rgba(255,255,255,0.12);
-            box-shadow: 0 10px 26px rgba(0,0,0,0.22);
-            backdrop-filter: blur(16px);
-            height: 100%;
-        ">
-            <div style="font-size:1.1rem; font-weight:750; margin-bottom:8px;">
-                {title}
-            </div>
-            <div style="color: rgba(255,255,255,0.82); font-size:0.98rem; line-height:1.55;">
-                {body_html}
-            </div>
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
+    return _MINI_CARD_TPL.substitute(title=title, body_html=body_html)
 
 
-def _html_list(items):
-    lis = "\n".join([f"<li>{it.replace(chr(10), '<br>').replace('  ', '&nbsp;&nbsp;')}</li>" for it in items])
-    return f"<ul style='margin-top:0; line-height:1.9;'>{lis}</ul>"
+@lru_cache(maxsize=64)
+def _html_list(items: tuple) -> str:
+    lis = "".join("<li>" + it.replace("\n", "<br>").replace("  ", "&nbsp;&nbsp;") + "</li>" for it in items)
+    return f"<ul class='pf-list'>{lis}</ul>"
 
 
-# Kept from old draft (even if not used anymore) to avoid breaking anything if you re-add later.
-def _req_block(title: str, lines):
-    st.markdown(
-        f"""
-        <div style="
-            border-radius: 16px;
-            padding: 14px 14px 12px 14px;
-            background: rgba(10, 15, 30, 0.30);
-            border: 1px solid rgba(255,255,255,0.10);
-            margin-bottom: 12px;
-        ">
-            <div style="font-size:1.05rem; font-weight:800; margin-bottom:10px; opacity:0.95;">
-                {title}
-            </div>
-            <pre style="
-                margin:0;
-                padding: 12px;
-                border-radius: 12px;
-                background: rgba(255,255,255,0.06);
-                border: 1px solid rgba(255,255,255,0.10);
-                overflow-x:auto;
-                font-size: 0.95rem;
-                line-height: 1.55;
-            ">{chr(10).join(lines)}</pre>
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
+def _card_row_html(*cards: str) -> str:
+    # Side-by-side cards as one CSS grid instead of st.columns; wraps to one column on narrow screens.
+    return "<div class='pf-card-row'>" + "".join(cards) + "</div>"
 
 
-def render_about_page():
-    _section_title(
-        "Pathfind — About",
-        "A live, interactive travel planner dashboard — documentation for workflow, data, scoring, modules, and integrations.",
-    )
-    tab_css = """
-    <style>
-        /* Make tab container full width */
-        .stTabs {
-            width: 100% !important;
-        }
-        
-        /* Tab list - full width, no gaps */
-        .stTabs [data-baseweb="tab-list"] {
-            gap: 0 !important;
-            width: 100% !important;
-            border-bottom: 1px solid rgba(0, 0, 0, 0.1) !important;
-        }
-        
-        /* Individual tabs - stretched, transparent */
-        .stTabs [data-baseweb="tab"] {
-            height: auto !important;
-            flex-grow: 1 !important;
-            background-color: transparent !important;
-            border: none !important;
-            border-bottom: 3px solid transparent !important;
-            color: var(--text-color, #31333F) !important;
-            font-weight: 500 !important;
-            padding: 14px 20px !important;
-            margin: 0 !important;
-            transition: all 0.3s ease !important;
-            text-align: center !important;
-        }
-        
-        /* Tab hover state */
-        .stTabs [data-baseweb="tab"]:hover {
-            border-bottom-color: var(--primary-color, #1f6e8a) !important;
-            background-color: rgba(31, 110, 138, 0.08) !important;
-        }
-        
-        /* Active tab - colored bottom border */
-        .stTabs [aria-selected="true"] [data-baseweb="tab"] {
-            border-bottom-color: var(--primary-color, #1f6e8a) !important;
-            color: var(--primary-color, #1f6e8a) !important;
-            background-color: rgba(31, 110, 138, 0.05) !important;
-        }
-        
-        /* Tab content - semi-transparent background + border */
-        .stTabs [data-baseweb="tab-panel"] {
-            padding: 24px !important;
-            border: 1px solid rgba(0, 0, 0, 0.08) !important;
-            border-top: 3px solid var(--primary-color, #1f6e8a) !important;
-            border-radius: 0 0 8px 8px !important;
-            background-color: rgba(255, 255, 255, 0.4) !important;
-            backdrop-filter: blur(10px) !important;
-            -webkit-backdrop-filter: blur(10px) !important;
-        }
-        
-        /* Remove extra padding/margin */
-        .stTabs [data-baseweb="tabs"] {
-            margin-bottom: 0 !important;
-            width: 100% !important;
-        }
-    </style>
-    """
-    st.markdown(tab_css, unsafe_allow_html=True)
-    
-    tabs = st.tabs(
-        [
-            "Overview",
-            "Workflow",
-            "Data & Sources",
-            "Scoring",
-            "Modules",
-            "What makes Pathfind special",
-            "Impressum",
-        ]
+def _details_html(title: str, body_md: str, expanded: bool = False) -> str:
+    # Native collapsible instead of st.expander. The blank lines around the body
+    # end the HTML block so the Markdown inside is still parsed.
+    return (
+        f"<details class='pf-details'{' open' if expanded else ''}><summary>{title}</summary>"
+        f"\n\n{textwrap.dedent(body_md).strip()}\n\n"
+        "</details>"
     )
 
-    # ------------------------------------------------------------
-    # OVERVIEW
-    # ------------------------------------------------------------
-    with tabs[0]:
-        _section_title(
+
+# ------------------------------------------------------------
+# OVERVIEW
+# ------------------------------------------------------------
+def _render_overview():
+    _render(
+        _section_title_html(
             "What is Pathfind?",
             "A live and interactive travel planning dashboard with explainable ranking and integrated planning tools.",
-        )
-
-        st.markdown(
-            """
+        ),
+        """
 **Pathfind is a live and interactive Streamlit dashboard** that helps users discover travel destinations that match their preferences.  
 Users can explore destinations by dynamically adjusting profiles, sliders, filters, and constraints — and the ranking updates immediately as the system recomputes scores.
 
@@ -185,17 +87,13 @@ Pathfind is **live** because selected components rely on live API calls (e.g., f
 
 Pathfind can also optionally check **visa requirements** (powered by Travel Buddy) by matching the user’s selected nationality against destination-specific rules.
 This feature integrates visa information directly into the destination overview and planning flow.
-            """
-        )
-
-        st.markdown("<div style='height:10px;'></div>", unsafe_allow_html=True)
-
-        a, b = st.columns([1, 1])
-        with a:
-            _mini_card(
+        """,
+        _spacer(10),
+        _card_row_html(
+            _mini_card_html(
                 "What you get",
                 _html_list(
-                    [
+                    (
                         "A ranked list of destinations (Top Matches)",
                         "Transparent score explanations (\"Peek behind the score\")",
                         "Country dashboard with contextual travel information",
@@ -205,128 +103,118 @@ This feature integrates visa information directly into the destination overview
                         "Optional calendar export",
                         "Optional chatbot interaction for Q&A, explanations, and planning",
                         "Optional export/summary as PDF",
-                    ]
+                    )
                 ),
-            )
-        with b:
-            _mini_card(
+            ),
+            _mini_card_html(
                 "What this is not",
                 _html_list(
-                    [
+                    (
                         "Not a guarantee of safety, pricing, or availability",
                         "Not a replacement for official advisories",
                         "Not a pure booking engine (estimates can differ from market prices)",
                         "Not a city-level model — many inputs are country-level averages",
-                    ]
+                    )
                 ),
-            )
+            ),
+        ),
+    )
 
-    # ------------------------------------------------------------
-    # WORKFLOW
-    # ------------------------------------------------------------
-    with tabs[1]:
-        _section_title("Workflow", "How users move through Pathfind")
 
-        st.markdown(
-            """
+# ------------------------------------------------------------
+# WORKFLOW
+# ------------------------------------------------------------
+def _render_workflow():
+    _render(
+        _section_title_html("Workflow", "How users move through Pathfind"),
+        """
 The app is structured as a step-based flow using `st.session_state["step"]`.  
 A typical user run looks like this:
+        """,
+        _details_html(
+            "Step 1 — Basic Setup (Origin, Dates, Filters)",
             """
-        )
-
-        with st.expander("Step 1 — Basic Setup (Origin, Dates, Filters)", expanded=True):
-            st.markdown(
-                """
 - Users select origin and travel dates and can activate optional filters (e.g., safety-related indicators).
 - Optionally select nationality for visa requirement checks (Travel Buddy).  
 
 This step initializes a new run (including fresh randomized elements used later in the flow).
-                """
-            )
-
-        with st.expander("Step 2 — Persona Selector", expanded=False):
-            st.markdown(
-                """
+            """,
+            expanded=True,
+        ),
+        _details_html(
+            "Step 2 — Persona Selector",
+            """
 Users choose a persona (e.g., budget, explorer, comfort-oriented).  
 Personas set structured default weights across decision dimensions.
-                """
-            )
-
-        with st.expander("Step 3 — Swipe Interaction (Compact Preference Refinement)", expanded=False):
-            st.markdown(
-                """
+            """,
+        ),
+        _details_html(
+            "Step 3 — Swipe Interaction (Compact Preference Refinement)",
+            """
 Pathfind uses a compact swipe flow: the app draws a small set of swipe cards per run.
 - The selection is randomized but stable within a run.
 - Each swipe updates weights and preferences (e.g., climate preference, cost emphasis, air quality).
-                """
-            )
-
-        with st.expander("Step 4 — Optional Extensions (e.g., Tarot inspiration)", expanded=False):
-            st.markdown(
-                """
+            """,
+        ),
+        _details_html(
+            "Step 4 — Optional Extensions (e.g., Tarot inspiration)",
+            """
 Users can optionally activate playful extensions that modify the candidate set or apply controlled boosts.
-                """
-            )
-
-        with st.expander("Step 5 — Ban List / Region Exclusions (Optional)", expanded=False):
-            st.markdown(
-                """
+            """,
+        ),
+        _details_html(
+            "Step 5 — Ban List / Region Exclusions (Optional)",
+            """
 Users can exclude world regions.  
 Excluded regions are mapped to ISO3 country lists and removed prior to scoring.
-                """
-            )
-
-        with st.expander("Step 6 — Matching Results + Explanation", expanded=False):
-            st.markdown(
-                """
+            """,
+        ),
+        _details_html(
+            "Step 6 — Matching Results + Explanation",
+            """
 The system loads the base dataset, applies filters, computes sub-scores and a final score, and displays top destinations.
 Each result includes an explanation showing how categories contributed to the match.
-                """
-            )
-
-        with st.expander("Step 7 — Country Dashboard + Planning", expanded=False):
-            st.markdown(
-                """
+            """,
+        ),
+        _details_html(
+            "Step 7 — Country Dashboard + Planning",
+            """
 Users inspect destination details and can use planning modules:
 - Cost Estimator (trip budgeting)
 - Trip Planner (itinerary / routing support)
 - Optional chat assistance for questions and planning (if enabled)
-                """
-            )
-
-        with st.expander("Step 8–9 — Booking + Confirmation (Flights + Calendar Export)", expanded=False):
-            st.markdown(
-                """
+            """,
+        ),
+        _details_html(
+            "Step 8–9 — Booking + Confirmation (Flights + Calendar Export)",
+            """
 Users can proceed to flight search and optionally export calendar events via Google OAuth (if enabled).
-                """
-            )
-
-        st.markdown("---")
-        _mini_card(
+            """,
+        ),
+        "---",
+        _mini_card_html(
             "Run behavior (freshness)",
             _html_list(
-                [
+                (
                     "Within a run, randomized components remain stable so the experience is consistent.",
                     "Starting a new run resets the flow and refreshes randomized elements for variety.",
-                ]
+                )
             ),
-        )
+        ),
+    )
 
-    # ------------------------------------------------------------
-    # DATA & SOURCES
-    # ------------------------------------------------------------
-    with tabs[2]:
-        _section_title("Data & Sources", "Database structure, providers, and credits")
 
-        st.markdown(
-            """
+# ------------------------------------------------------------
+# DATA & SOURCES
+# ------------------------------------------------------------
+def _render_data_sources():
+    _render(
+        _section_title_html("Data & Sources", "Database structure, providers, and credits"),
+        """
 All structured country-level data is stored in a unified SQLite database (`unified_country_database.db`), which serves as the single source of truth.
 The database combines curated data and regularly updated snapshots of external sources.
-            """
-        )
-
-        st.markdown(
-            """
+        """,
+        """
 ### How the database is organized (conceptual)
 
 Pathfind is built around a **country backbone** that uses standardized **ISO3 country codes** to merge data from multiple domains.
@@ -341,41 +229,34 @@ In practice, the database contains:
 
 When Pathfind builds the candidate set for scoring, it merges these entities primarily through **ISO3 keys** (and, for flights, via **airport/IATA mappings**).
 This structure keeps the system maintainable (tables can be updated independently) and makes it easier to explain where each signal originates.
-            """
-        )
-
-        _mini_card(
+        """,
+        _mini_card_html(
             "Examples of entities (not exhaustive)",
             _html_list(
-                [
+                (
                     "<b>countries</b>: ISO3 backbone and country metadata",
                     "<b>numbeo_indices / numbeo_items / numbeo_prices</b>: indices, item taxonomy, and price snapshots used for both scoring and budgeting",
                     "<b>tugo_entry / tugo_safety / tugo_health / tugo_laws / tugo_offices</b>: structured travel information stored as database tables",
                     "<b>unesco_by_country / unesco_heritage_sites</b>: heritage counts and site metadata",
                     "<b>climate_monthly</b>: aggregated climate indicators (monthly averages)",
                     "<b>airports / flight_costs</b>: airport mapping layer and flight-cost samples for fast flight context",
-                ]
+                )
             ),
-        )
-
-        st.markdown("### How the base dataset is assembled")
-        st.markdown(
-            """
+        ),
+        "### How the base dataset is assembled",
+        """
 Pathfind assembles a country-level candidate dataset by joining:
 - a core country table with indices/prices, climate aggregates, heritage counts, and equality-related indicators,
 - and (optionally) flight context via airport mapping + flight cost samples.  
 
 After joins, the dataset is deduplicated to one row per country (ISO3), preferring rows with fewer missing values.  
 This provides a stable base for ranking while keeping the underlying entities modular and updateable.
-            """
-        )
-
-        st.markdown("<div style='height:10px;'></div>", unsafe_allow_html=True)
-
-        _mini_card(
+        """,
+        _spacer(10),
+        _mini_card_html(
             "Data providers & credits",
             _html_list(
-                [
+                (
                     "<b>Numbeo API</b> — cost of living indices and item-level prices (scoring + cost estimator)",
                     "<b>Tugo API</b> — travel advisories (safety / health / entry), stored as database tables",
                     "<b>Auswärtiges Amt API</b> — official travel information (Germany)",
@@ -390,34 +271,33 @@ This provides a stable base for ranking while keeping the underlying entities mo
                     "<b>OpenTravelData (Github)</b> — data for airports",
                     "<b>gettocenter.com</b> — scraped to obtain passenger volume of airports",
                     "<b>Unsplash API</b> — images for countries",
-                ]
+                )
             ),
-        )
-
-        _mini_card(
+        ),
+        _mini_card_html(
             "API keys and setup note",
             _html_list(
-                [
+                (
                     "Some functionality requires API keys (e.g., flights, routing, chatbot interaction).",
                     "In addition, some database-backed signals originate from providers whose data is refreshed over time (e.g., travel advisories).",
                     "Setup instructions, dependencies, and packages are documented in the GitHub repository.",
-                ]
+                )
             ),
-        )
-
-        _mini_card(
+        ),
+        _mini_card_html(
             "Important note",
             "Several signals are country-level aggregates. They provide guidance but cannot capture city-level or individual-level variation.",
-        )
+        ),
+    )
 
-    # ------------------------------------------------------------
-    # SCORING
-    # ------------------------------------------------------------
-    with tabs[3]:
-        _section_title("Scoring", "Explainable matching and ranking")
 
-        st.markdown(
-            """
+# ------------------------------------------------------------
+# SCORING
+# ------------------------------------------------------------
+def _render_scoring():
+    _render(
+        _section_title_html("Scoring", "Explainable matching and ranking"),
+        """
 Pathfind computes interpretable sub-scores in the range 0–1 and combines them into a final score using user-defined weights.
 The goal is transparency: users should be able to understand why a destination ranks high or low.
 
@@ -427,23 +307,23 @@ At a high level, scoring follows the same structure across categories:
 2) transform raw indicators into comparable 0–1 sub-scores  
 3) combine sub-scores using weights derived from personas + interactions  
 4) produce explanations that show category contributions (“Peek behind the score”)
-            """
-        )
+        """
+    )
 
-        with st.expander("Step A — Candidate set & preprocessing", expanded=True):
-            st.markdown(
-                """
+    with st.expander("Step A — Candidate set & preprocessing", expanded=True):
+        st.markdown(
+            """
 Before any scoring happens, Pathfind constructs a candidate set of countries:
 
 - Countries are loaded from the unified database and merged across domains using ISO3 keys.
 - Filters remove countries that should not be considered (e.g., region exclusions or safety-related filters).
 - If multiple rows can exist for a country after joins (due to missingness or duplicates), the dataset is deduplicated to a single ISO3 row.
-                """
-            )
+            """
+        )
 
-        with st.expander("Step B — Missing value handling (neutral & conservative)", expanded=False):
-            st.markdown(
-                """
+    with st.expander("Step B — Missing value handling (neutral & conservative)", expanded=False):
+        st.markdown(
+            """
 Pathfind integrates multiple data sources (e.g., cost indices, climate, flights, safety and equality indicators).
 Because coverage differs across providers, some values can be missing.
 
@@ -456,12 +336,12 @@ Missing values are handled conservatively to keep the ranking stable and fair:
 - In the UI (e.g., cost estimator or flight information), missing data is explicitly marked rather than guessed.
 
 This strategy avoids automatically penalizing destinations simply because some data is unavailable.
-                """
-            )
-        
-        with st.expander("Step C — Outlier handling (winsorization)", expanded=False):
-            st.markdown(
-                """
+            """
+        )
+    
+    with st.expander("Step C — Outlier handling (winsorization)", expanded=False):
+        st.markdown(
+            """
 Raw indicators can contain extreme values that would dominate a min–max scaling.
 To keep the ranking stable, Pathfind applies winsorization to numeric indicators:
 
@@ -469,12 +349,12 @@ To keep the ranking stable, Pathfind applies winsorization to numeric indicators
 - Values above the 95th percentile are capped at the 95th percentile.
 
 This keeps scoring sensitive to meaningful differences while preventing single outliers from pushing everything else toward 0.
-                """
-            )
+            """
+        )
 
-        with st.expander("Step D — Normalization to 0–1", expanded=False):
-            st.markdown(
-                """
+    with st.expander("Step D — Normalization to 0–1", expanded=False):
+        st.markdown(
+            """
 After winsorization, indicators are normalized to a common scale:
 
 - Standard approach: min–max scaling to the range 0–1.
@@ -487,12 +367,12 @@ Examples:
 - higher purchasing power or QoL → higher score (direct scale)
 
 The result is a set of comparable sub-scores per country, each interpretable on a 0–1 scale.
-                """
-            )
+            """
+        )
 
-        with st.expander("Step E — Weighting and aggregation", expanded=False):
-            st.markdown(
-                """
+    with st.expander("Step E — Weighting and aggregation", expanded=False):
+        st.markdown(
+            """
 Weights represent “importance budgets” over categories:
 
 - Persona selection provides a sensible default weight profile.
@@ -507,12 +387,12 @@ Final aggregation:
 - `final_score_raw` is computed as a weighted sum of sub-scores.
 - The final score is kept comparable (not artificially rescaled to force #1 to 100%).
 - Countries are ranked by this score and displayed as Top Matches.
-                """
-            )
+            """
+        )
 
-        with st.expander("Step F — Explanations (“Peek behind the score”)", expanded=False):
-            st.markdown(
-                """
+    with st.expander("Step F — Explanations (“Peek behind the score”)", expanded=False):
+        st.markdown(
+            """
 Pathfind creates user-facing explanations by keeping intermediate quantities explicit:
 
 - Sub-scores remain accessible (e.g., cost score, clean-air score, climate score, safety-related scores).
@@ -520,64 +400,58 @@ Pathfind creates user-facing explanations by keeping intermediate quantities exp
 - Explanations summarize the top positive and negative contributions so users can see what drives ranking.
 
 This is intentionally not a black-box model: the scoring pipeline is designed to be inspectable and debuggable.
-                """
-            )
+            """
+        )
 
-        with st.expander("Controlled randomness (stability within a run)", expanded=False):
-            st.markdown(
-                """
+    with st.expander("Controlled randomness (stability within a run)", expanded=False):
+        st.markdown(
+            """
 Pathfind uses controlled randomness to diversify close outcomes and break ties.
 
 - Randomized elements remain stable within a run so behavior is reproducible when debugging.
 - A new run refreshes randomized components for variety.
 
 This avoids the situation where tiny floating-point differences or ties make rankings feel repetitive, while still keeping the system understandable.
-                """
-            )
-
-    # ------------------------------------------------------------
-    # MODULES (merged)
-    # ------------------------------------------------------------
-    with tabs[4]:
-        _section_title("Modules", "Core components in the dashboard")
-
-        st.markdown(
-            """
-Pathfind is implemented as a modular set of mini-apps inside one unified dashboard.
-The core ranking is database-driven (fast and repeatable), while several modules add live functionality through APIs.
             """
         )
 
-        st.markdown("<div style='height:6px;'></div>", unsafe_allow_html=True)
 
-        a, b = st.columns([1, 1])
-        with a:
-            _mini_card(
+# ------------------------------------------------------------
+# MODULES (merged)
+# ------------------------------------------------------------
+def _render_modules():
+    _render(
+        _section_title_html("Modules", "Core components in the dashboard"),
+        """
+Pathfind is implemented as a modular set of mini-apps inside one unified dashboard.
+The core ranking is database-driven (fast and repeatable), while several modules add live functionality through APIs.
+        """,
+        _spacer(6),
+        _card_row_html(
+            _mini_card_html(
                 "Cost Estimator (budget planning)",
                 _html_list(
-                    [
+                    (
                         "Uses item-level prices and indices to translate “cost of living” into a planning budget.",
                         "Builds a transparent breakdown (e.g., food, transport, everyday items) rather than one opaque number.",
                         "Scales by trip duration and group size; can incorporate exchange-rate snapshots when available.",
                         "Designed for planning and comparison — real costs vary by location, season, and travel style.",
-                    ]
+                    )
                 ),
-            )
-        with b:
-            _mini_card(
+            ),
+            _mini_card_html(
                 "Flight Search (DB; live)",
                 _html_list(
-                    [
+                    (
                         "Destinations Page: estimated flight costs from the database <br>&nbsp;&nbsp;• Note: because of rate limits estimated flight costs are only available when Germany or US are selected as nationality)",
                         "Flight Search Module: live flight search via Amadeus when the user proceeds (dates, passengers, origin/destination airports).<br>&nbsp;&nbsp;• Provides the complete experience: <div style='margin-top:8px; display:flex; align-items:center; gap:6px; font-size:0.85rem;'><span style='background:rgba(255,255,255,0.08); padding:2px 8px; border-radius:6px; border:1px solid rgba(255,255,255,0.1);'>Search Flight</span><span style='opacity:0.4;'>→</span><span style='background:rgba(255,255,255,0.08); padding:2px 8px; border-radius:6px; border:1px solid rgba(255,255,255,0.1);'>Confirm Price</span><span style='opacity:0.4;'>→</span><span style='background:rgba(255,255,255,0.08); padding:2px 8px; border-radius:6px; border:1px solid rgba(255,255,255,0.1);'>Book Flight</span></div>"
                         ""
-                    ]
+                    )
                 ),
-            )
-
-        a, b = st.columns([1, 1])
-        with a:
-            _mini_card(
+            ),
+        ),
+        _card_row_html(
+            _mini_card_html(
                 "Trip Planner",
                 (
                     "<div style='font-size:0.88rem; border-left: 3px solid #1f6e8a; padding-left: 12px; margin-bottom: 12px;'>"
@@ -606,109 +480,101 @@ The core ranking is database-driven (fast and repeatable), while several modules
                     "• <i>Reportlab:</i> Converts the chatbot's conversational output into a structured PDF."
                     "</div>"
                 )
-            )
-        with b:
-            _mini_card(
+            ),
+            _mini_card_html(
                 "Chatbot interaction (Q&A and planning support)",
                 _html_list(
-                    [
+                    (
                         "Retrieves TUGO health and safety data from the DB; uses this data to answer the user request.",
                         "Natural-language interface for questions about destinations, safety context, budgets, and planning.",
                         "Can generate itinerary ideas under constraints (e.g., “2 days, low budget, nature + cafés”).",
                         "Human-in-the-loop: the user controls preferences; the assistant retrieves data and supports exploration.",
-                        
-                    ]
+                    
+                    )
                 ),
-            )
-
-        st.markdown(
-            """
+            ),
+        ),
+        """
 Export and reporting features (e.g., PDF summaries) can be enabled in the main dashboard to support planning and sharing.
-            """
-        )
+        """,
+    )
 
-    # ------------------------------------------------------------
-    # WHAT MAKES PATHFIND SPECIAL 
-    # ------------------------------------------------------------
-    with tabs[5]:
-        _section_title("What makes Pathfind special", "Design choices, performance, and future potential")
 
-        row1a, row1b = st.columns([1, 1])
-        with row1a:
-            _mini_card(
+# ------------------------------------------------------------
+# WHAT MAKES PATHFIND SPECIAL 
+# ------------------------------------------------------------
+def _render_special():
+    _render(
+        _section_title_html("What makes Pathfind special", "Design choices, performance, and future potential"),
+        _card_row_html(
+            _mini_card_html(
                 "Modular mini-app architecture",
                 _html_list(
-                    [
+                    (
                         "Features are implemented as separate modules and orchestrated in the main dashboard",
                         "Improves maintainability, testability, and parallel team development",
                         "Enables isolated debugging of individual components",
-                    ]
+                    )
                 ),
-            )
-        with row1b:
-            _mini_card(
+            ),
+            _mini_card_html(
                 "Performance-aware design",
                 _html_list(
-                    [
+                    (
                         "Unified SQLite database as single source of truth for most signals",
                         "Two-stage design: DB-backed estimates first, optional live APIs second",
                         "Avoids unnecessary API calls and keeps the dashboard responsive",
                         "Leverages parallel execution for concurrent API calls and database lookups, significantly reducing latency during complex planning workflows which brought down the result generation of the trip planner from around 6 minutes to around 2 minutes",
-                    ]
+                    )
                 ),
-            )
-
-        row2a, row2b = st.columns([1, 1])
-        with row2a:
-            _mini_card(
+            ),
+        ),
+        _card_row_html(
+            _mini_card_html(
                 "Debug-friendly & reproducible",
                 _html_list(
-                    [
+                    (
                         "Intermediate sub-scores make behavior transparent",
                         "Within-run stability supports reproducibility during debugging",
                         "Issues can be reproduced systematically when a configuration is known",
-                    ]
+                    )
                 ),
-            )
-        with row2b:
-            _mini_card(
+            ),
+            _mini_card_html(
                 "Hybrid live system",
                 _html_list(
-                    [
+                    (
                         "Live modules rely on API calls (flights, routing, chat interaction)",
                         "Database stores curated data and is daily updated with selected sources (travel safety, health information, exchange rates and country indices)",
                         "Clear separation between fast offline-capable signals and live services",
-                    ]
+                    )
                 ),
-            )
-
-        row3a, row3b = st.columns([1, 1])
-        with row3a:
-            _mini_card(
+            ),
+        ),
+        _card_row_html(
+            _mini_card_html(
                 "Explainability first",
                 _html_list(
-                    [
+                    (
                         "No black-box recommendation model",
                         "Users can inspect why a destination ranks high or low",
                         "Score explanations connect preferences to outcomes",
-                    ]
+                    )
                 ),
-            )
-        with row3b:
-            _mini_card(
+            ),
+            _mini_card_html(
                 "Beyond typical travel planners",
                 _html_list(
-                    [
+                    (
                         "Not centered solely around booking conversion",
                         "Integrates contextual indicators (entry, safety, equality, heritage, climate, affordability)",
                         "Designed for exploration, transparency, and research-oriented comparison",
-                    ]
+                    )
                 ),
-            )
-
-        st.markdown("<div style='height:10px;'></div>", unsafe_allow_html=True)
-        
-        _mini_card(
+            ),
+        ),
+        _spacer(10),
+        _mini_card_html(
             "Future Potential",
             (
                 "<div style='margin-bottom:10px;'>"
@@ -741,55 +607,227 @@ Export and reporting features (e.g., PDF summaries) can be enabled in the main d
                 "<li>More in-flow chat usage for planning (itinerary drafts, constraints, follow-up questions).</li>"
                 "</ul>"
             ),
-        )
+        ),
+    )
 
-    # ------------------------------------------------------------
-    # IMPRESSUM (now includes privacy notice + github link)
-    # ------------------------------------------------------------
-    with tabs[6]:
-        _section_title("Impressum", "Project context, contributors, and privacy notice")
 
-        st.markdown(
-            """
+# ------------------------------------------------------------
+# IMPRESSUM (now includes privacy notice + github link)
+# ------------------------------------------------------------
+def _render_impressum():
+    _render(
+        _section_title_html("Impressum", "Project context, contributors, and privacy notice"),
+        """
 This dashboard was developed as part of a university group project.
 
 **Professor:** Marc Ratkovic  
 **Chair:** Chair of Social Data Science  
 **Module:** Seminar and Lab Machine Learning  
-            """
-        )
-
-        _mini_card(
+        """,
+        _mini_card_html(
             "Producers",
             _html_list(
-                [
+                (
                     "Fritz Bumb",
                     "Clara Oppenländer",
                     "Luis Nepomuk Götze",
                     "Thomas Petrausch",
-                ]
+                )
             ),
-        )
-
-        _mini_card(
+        ),
+        _mini_card_html(
             "Repository",
             "GitHub: https://github.com/clara-opp/pathfind",
-        )
-
-        _mini_card(
+        ),
+        _mini_card_html(
             "Privacy notice / data protection",
             _html_list(
-                [
+                (
                     "Pathfind does not permanently store personal user data.",
                     "User inputs and preferences are handled within the Streamlit session context.",
                     "API keys are never shown in the UI and should be provided via environment variables during development/deployment.",
                     "This dashboard is intended for research, learning, and demonstration purposes.",
-                ]
+                )
             ),
-        )
+        ),
+    )
+
+    today = datetime.date.today().isoformat()
+    st.caption(f"Last rendered: {today}")
+
+
+TAB_LABELS = [
+    "Overview",
+    "Workflow",
+    "Data & Sources",
+    "Scoring",
+    "Modules",
+    "What makes Pathfind special",
+    "Impressum",
+]
+
+_RENDERERS = dict(
+    zip(
+        TAB_LABELS,
+        [
+            _render_overview,
+            _render_workflow,
+            _render_data_sources,
+            _render_scoring,
+            _render_modules,
+            _render_special,
+            _render_impressum,
+        ],
+    )
+)
 
-        today = datetime.date.today().strftime("%Y-%m-%d")
-        st.caption(f"Last rendered: {today}")
+# st.tabs runs and ships the body of every tab on each rerun, so the sections
+# are switched with a radio styled as a tab bar and only the selected one is built.
+# The stylesheet goes out with every run: Streamlit rebuilds the page each rerun.
+_ABOUT_CSS = textwrap.dedent(
+    """
+    <style>
+        /* Tab bar - full width, no gaps */
+        .st-key-about_active_tab [role="radiogroup"] {
+            gap: 0 !important;
+            width: 100% !important;
+            flex-wrap: nowrap !important;
+            border-bottom: 1px solid rgba(0, 0, 0, 0.1) !important;
+        }
+
+        /* Individual tabs - stretched, transparent */
+        .st-key-about_active_tab [role="radiogroup"] > label {
+            flex-grow: 1 !important;
+            justify-content: center !important;
+            background-color: transparent !important;
+            border-bottom: 3px solid transparent !important;
+            color: var(--text-color, #31333F) !important;
+            font-weight: 500 !important;
+            padding: 14px 20px !important;
+            margin: 0 !important;
+            transition: all 0.3s ease !important;
+            text-align: center !important;
+            cursor: pointer !important;
+        }
+
+        /* Hide the radio dot */
+        .st-key-about_active_tab [role="radiogroup"] > label > div:first-child {
+            display: none !important;
+        }
+
+        /* Tab hover state */
+        .st-key-about_active_tab [role="radiogroup"] > label:hover {
+            border-bottom-color: var(--primary-color, #1f6e8a) !important;
+            background-color: rgba(31, 110, 138, 0.08) !important;
+        }
+
+        /* Active tab - colored bottom border */
+        .st-key-about_active_tab [role="radiogroup"] > label:has(input:checked) {
+            border-bottom-color: var(--primary-color, #1f6e8a) !important;
+            color: var(--primary-color, #1f6e8a) !important;
+            background-color: rgba(31, 110, 138, 0.05) !important;
+        }
+
+        /* Tab content - semi-transparent background + border */
+        .st-key-about_tab_panel {
+            padding: 24px !important;
+            border: 1px solid rgba(0, 0, 0, 0.08) !important;
+            border-top: 3px solid var(--primary-color, #1f6e8a) !important;
+            border-radius: 0 0 8px 8px !important;
+            background-color: rgba(255, 255, 255, 0.4) !important;
+            backdrop-filter: blur(10px) !important;
+            -webkit-backdrop-filter: blur(10px) !important;
+        }
+
+        /* Section title card */
+        .pf-section {
+            margin-top: 0.25rem;
+            padding: 18px 18px 14px 18px;
+            border-radius: 16px;
+            background: rgba(15, 20, 40, 0.35);
+            border: 1px solid rgba(255, 255, 255, 0.12);
+            backdrop-filter: blur(18px);
+            box-shadow: 0 10px 30px rgba(0,0,0,0.25);
+        }
+        .pf-section-title {
+            font-size: 1.9rem;
+            font-weight: 800;
+            letter-spacing: -0.5px;
+        }
+        .pf-section-sub {
+            margin-top: 6px;
+            color: rgba(255,255,255,0.78);
+            font-size: 1.05rem;
+            line-height: 1.4;
+        }
+
+        /* Mini cards and card rows */
+        .pf-mini {
+            border-radius: 16px;
+            padding: 16px 16px 14px 16px;
+            background: rgba(25, 35, 55, 0.45);
+            border: 1px solid rgba(255,255,255,0.12);
+            box-shadow: 0 10px 26px rgba(0,0,0,0.22);
+            backdrop-filter: blur(16px);
+            height: 100%;
+        }
+        .pf-mini-title {
+            font-size: 1.1rem;
+            font-weight: 750;
+            margin-bottom: 8px;
+        }
+        .pf-mini-body {
+            color: rgba(255,255,255,0.82);
+            font-size: 0.98rem;
+            line-height: 1.55;
+        }
+        .pf-list {
+            margin-top: 0;
+            line-height: 1.9;
+        }
+        .pf-card-row {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(280px, 1fr));
+            gap: 16px;
+            margin-bottom: 16px;
+        }
+
+        /* Collapsible steps */
+        .pf-details {
+            border: 1px solid rgba(128,128,128,0.25);
+            border-radius: 8px;
+            padding: 0 14px;
+            margin-bottom: 8px;
+        }
+        .pf-details > summary {
+            cursor: pointer;
+            font-weight: 600;
+            padding: 10px 0;
+        }
+    </style>
+    """
+).strip()
+
+
+@st.fragment
+def render_about_page():
+    _render(
+        _section_title_html(
+            "Pathfind — About",
+            "A live, interactive travel planner dashboard — documentation for workflow, data, scoring, modules, and integrations.",
+        ),
+        _ABOUT_CSS,
+    )
+
+    active = st.radio(
+        "Section",
+        TAB_LABELS,
+        horizontal=True,
+        key="about_active_tab",
+        label_visibility="collapsed",
+    )
+    with st.container(key="about_tab_panel"):
+        _RENDERERS[active]()
 
 
 # Optional: allow quick standalone testing
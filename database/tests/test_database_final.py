@@ -0,0 +1,49 @@
+import pandas as pd
+import pytest
+
+import database_final
+
+
+@pytest.fixture(autouse=True)
+def no_loader_cache(monkeypatch):
+    monkeypatch.setenv("NO_LOADER_CACHE", "1")
+
+
+def test_one_row_per_key_prefers_matching_name():
+    df = pd.DataFrame(
+        {"numbeo_country_name": ["Alderney", "Germany", "Guernsey"], "currency": ["GBP", "EUR", "GBP"]},
+        index=pd.Index(["GGY", "DEU", "GGY"], name="iso3"),
+    )
+    names = pd.Series(["Germany", "Guernsey"], index=["DEU", "GGY"])
+
+    result = database_final.one_row_per_key(df, "test", names, "numbeo_country_name")
+
+    assert list(result.index) == ["DEU", "GGY"]
+    assert result.at["GGY", "numbeo_country_name"] == "Guernsey"
+
+
+def test_one_row_per_key_falls_back_to_first_row():
+    df = pd.DataFrame(
+        {"value": [1, 2, 3]},
+        index=pd.Index(["GGY", None, "GGY"], name="iso3"),
+    )
+
+    result = database_final.one_row_per_key(df, "test")
+
+    assert list(result.index) == ["GGY"]
+    assert result.at["GGY", "value"] == 1
+
+
+def test_numbeo_ggy_is_guernsey():
+    iso_df = database_final.load_iso_codes()
+    names = iso_df["country_name"]
+
+    countries = database_final.one_row_per_key(
+        database_final.load_numbeo_countries(), "Numbeo countries", names, "numbeo_country_name"
+    )
+    indices = database_final.one_row_per_key(
+        database_final.load_numbeo_indices(), "Numbeo indices", names, "numbeo_country_name_indices"
+    )
+
+    assert countries.at["GGY", "numbeo_country_name"] == "Guernsey"
+    assert indices.at["GGY", "numbeo_country_name_indices"] == "Guernsey"
@@ -0,0 +1,40 @@
+import json
+
+import pytest
+
+import foreign_office_api
+
+
+@pytest.fixture
+def out_paths(tmp_path, monkeypatch):
+    out_path = tmp_path / "foreign_office_travelwarnings.json"
+    partial_path = out_path.with_suffix(".ndjson")
+    monkeypatch.setattr(foreign_office_api, "OUT_PATH", out_path)
+    monkeypatch.setattr(foreign_office_api, "PARTIAL_PATH", partial_path)
+    return out_path, partial_path
+
+
+def test_collect_with_nothing_pending(out_paths, monkeypatch):
+    out_path, partial_path = out_paths
+    monkeypatch.setattr(
+        foreign_office_api, "get_json", lambda path: {"response": {"contentList": []}}
+    )
+
+    assert foreign_office_api.collect() == []
+    assert json.loads(out_path.read_text(encoding="utf-8")) == []
+    assert not partial_path.exists()
+
+
+def test_collect_fetches_and_removes_partial(out_paths, monkeypatch):
+    out_path, partial_path = out_paths
+    payloads = {
+        "/travelwarning": {"response": {"123": {"countryCode": "DE", "title": "Deutschland"}}},
+        "/travelwarning/123": {"countryName": "Deutschland", "iso3CountryCode": "DEU"},
+    }
+    monkeypatch.setattr(foreign_office_api, "get_json", lambda path: payloads[path])
+
+    rows = foreign_office_api.collect()
+
+    assert [row["iso3_country_code"] for row in rows] == ["DEU"]
+    assert json.loads(out_path.read_text(encoding="utf-8")) == rows
+    assert not partial_path.exists()